@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Script benchmark render_ascii_grid: membandingkan waktu render mode putih
+dan mode berwarna untuk beberapa resolusi input dan lebar ASCII
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from video_to_ascii import bgr_frame_to_grid, render_ascii_grid
+
+# Resolusi input (nama, tinggi, lebar) dan lebar ASCII yang diukur
+INPUT_SIZES = [("480p", 480, 640), ("1080p", 1080, 1920)]
+ASCII_WIDTHS = [80, 160, 240]
+
+
+# Fungsi untuk mengukur waktu render mode putih dan berwarna secara berselang-seling
+def measure(char_grid, colors, font_size, iterations):
+    """
+    Menjalankan render putih dan berwarna bergantian agar gangguan sistem
+    mengenai keduanya secara merata
+
+    Args:
+        char_grid: Grid indeks karakter
+        colors: Warna per sel (BGR)
+        font_size: Ukuran font
+        iterations: Jumlah pengulangan
+
+    Returns:
+        Tuple (median ms putih, median ms berwarna, median rasio berwarna/putih)
+    """
+    # Pemanasan (cache glyph, alokasi pertama)
+    render_ascii_grid(char_grid, None, font_size)
+    render_ascii_grid(char_grid, colors, font_size)
+
+    gray_times = []
+    color_times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        render_ascii_grid(char_grid, None, font_size)
+        gray_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        render_ascii_grid(char_grid, colors, font_size)
+        color_times.append(time.perf_counter() - start)
+
+    gray_times = np.array(gray_times)
+    color_times = np.array(color_times)
+    return (np.median(gray_times) * 1000, np.median(color_times) * 1000,
+            np.median(color_times / gray_times))
+
+
+def main():
+    """
+    Fungsi utama: python benchmark_render.py [font_size] [iterasi]
+    """
+    font_size = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    # Frame acak: semua karakter dan warna muncul, hasilnya tidak bergantung isi gambar
+    rng = np.random.default_rng(0)
+
+    print(f"render_ascii_grid, font {font_size}px, {iterations} iterasi (median)")
+    print(f"{'Input':<6} {'Lebar':>5} {'Putih ms':>9} {'Warna ms':>9} {'Rasio':>6}")
+    for name, height, width in INPUT_SIZES:
+        frame = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        for ascii_width in ASCII_WIDTHS:
+            char_grid, colors = bgr_frame_to_grid(frame, ascii_width)
+            gray_ms, color_ms, ratio = measure(char_grid, colors, font_size, iterations)
+            print(f"{name:<6} {ascii_width:>5} {gray_ms:>9.2f} {color_ms:>9.2f} {ratio:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Script benchmark strategi resize: mengukur waktu, PSNR, dan persentase karakter
+yang sama dibanding rata-rata area yang tepat (float) untuk beberapa resolusi
+(tabel "Strategi Resize dan Rasio Sel Karakter" di README)
+"""
+
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from image_to_ascii import ASCII_LUT, RESIZE_STRATEGIES, ResizePlan, ascii_grid_size, resize_pixels
+
+# Resolusi input (nama, lebar, tinggi, jumlah iterasi) dan lebar ASCII yang diukur
+INPUT_SIZES = [("480p", 854, 480, 30), ("1080p", 1920, 1080, 10), ("4K", 3840, 2160, 5)]
+ASCII_WIDTH = 160
+
+
+# Fungsi untuk membuat frame uji dari foto dengan tekstur halus
+def make_frame(photo, width, height):
+    """
+    Memperbesar foto ke resolusi tujuan lalu menambahkan tekstur arsir halus
+    agar perbedaan aliasing antar strategi terlihat
+    
+    Args:
+        photo: Foto BGR sumber
+        width, height: Resolusi frame uji
+    
+    Returns:
+        Frame BGR uint8
+    """
+    image = cv2.resize(photo, (width, height), interpolation=cv2.INTER_CUBIC)
+    y, x = np.mgrid[:height, :width]
+    texture = ((np.sin(x * 0.9) + np.sin(y * 1.3)) * 40).astype(np.int16)
+    return np.clip(image.astype(np.int16) + texture[..., None], 0, 255).astype(np.uint8)
+
+
+# Fungsi untuk menghitung rata-rata area yang tepat (float) setiap sel
+def exact_area_mean(gray, rows, cols):
+    """
+    Referensi kualitas: rata-rata float piksel grayscale di area setiap sel
+    
+    Args:
+        gray: Frame grayscale
+        rows, cols: Ukuran grid
+    
+    Returns:
+        Array float64 berukuran (rows, cols)
+    """
+    plan = ResizePlan(gray.shape[0], gray.shape[1], rows, cols, 'area')
+    row_sums = np.add.reduceat(gray.astype(np.float64), plan.row_start, axis=0)
+    sums = np.add.reduceat(row_sums, plan.col_start, axis=1)
+    return sums / plan.cell_count
+
+
+# Fungsi untuk mengukur waktu rata-rata satu fungsi
+def measure(function, iterations):
+    """
+    Returns:
+        Waktu rata-rata per panggilan (ms)
+    """
+    function()  # Pemanasan (plan resize di-cache)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    """
+    Fungsi utama: python benchmark_resize.py [foto]
+    """
+    photo_path = sys.argv[1] if len(sys.argv) > 1 else "gambar1.jpeg"
+    photo = cv2.imread(photo_path)
+    if photo is None:
+        print(f"Error: Tidak dapat membuka gambar {photo_path}")
+        return
+    
+    print(f"Strategi resize, lebar {ASCII_WIDTH} karakter, foto {photo_path}")
+    print("| Input | Strategi | ms/frame | PSNR (dB) | Karakter sama |")
+    print("| ----- | -------- | -------- | --------- | ------------- |")
+    for name, width, height, iterations in INPUT_SIZES:
+        frame = make_frame(photo, width, height)
+        cols, rows = ascii_grid_size(width, height, ASCII_WIDTH)
+        reference = exact_area_mean(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), rows, cols)
+        reference_chars = ASCII_LUT[np.round(reference).astype(np.uint8)]
+        
+        for strategy in RESIZE_STRATEGIES:
+            elapsed = measure(lambda: resize_pixels(frame, cols, rows, strategy), iterations)
+            gray = cv2.cvtColor(np.ascontiguousarray(resize_pixels(frame, cols, rows, strategy)),
+                                cv2.COLOR_BGR2GRAY)
+            mse = ((gray - reference) ** 2).mean()
+            psnr = 10 * np.log10(255 ** 2 / mse) if mse > 0 else float('inf')
+            same = (ASCII_LUT[gray] == reference_chars).mean() * 100
+            print(f"| {name:<5} | {strategy:<8} | {elapsed:>8.2f} | {psnr:>9.1f} | {same:>12.1f}% |")
+
+
+if __name__ == "__main__":
+    main()
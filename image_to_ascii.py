@@ -3,17 +3,54 @@
 """
 Script untuk mengonversi file gambar menjadi ASCII art
 Menggunakan library Pillow dan numpy
+Mendukung gambar animasi (GIF/APNG) dan gambar multi-frame (TIFF)
 """
 
 import numpy as np
-from PIL import Image
+from PIL import Image, ImageSequence, GifImagePlugin
+from xml.sax.saxutils import escape
+import contextlib
+import functools
+import json
 import os
+import struct
 import sys
 import shutil
+import time
 
 # Mengatur karakter ASCII dari paling gelap hingga paling terang
 ASCII_CHARS = "@%#*+=-:. "
 
+# Durasi default (ms) untuk frame animasi yang tidak menyimpan durasi
+DEFAULT_FRAME_DURATION = 100
+
+# Rasio lebar/tinggi sel karakter (karakter terminal lebih tinggi daripada lebar)
+CELL_ASPECT = 0.55
+
+# Strategi downsampling gambar ke ukuran grid ASCII:
+#   area    - rata-rata semua piksel di area setiap sel (np.add.reduceat)
+#   box     - rata-rata area sel melalui integral image (summed-area table) di batas sel
+#   stride  - satu piksel di tengah setiap sel (paling cepat, bisa aliasing)
+#   lanczos - filter Lanczos dari Pillow (paling tajam, paling lambat)
+RESIZE_STRATEGIES = ('area', 'box', 'stride', 'lanczos')
+DEFAULT_RESIZE = 'area'
+
+# Format biner ASCII grid (.agrid): header little-endian
+#   magic (4s), versi (B), flag (B), panjang karakter (H), baris (I), kolom (I)
+GRID_MAGIC = b'AGRD'
+GRID_VERSION = 1
+GRID_FLAG_COLOR = 1
+GRID_HEADER_FORMAT = '<4sBBHII'
+
+# Mode tiled (gambar sangat besar): ukuran maksimum satu strip yang dibaca (byte)
+TILED_STRIP_BYTES = 16 * 1024 * 1024
+
+# Rawmode Pillow yang bisa dibaca langsung per strip: jumlah byte per piksel
+RAW_STRIP_MODES = {'L': 1, 'RGB': 3, 'BGR': 3, 'RGBX': 4, 'RGBA': 4, 'BGRX': 4, 'BGRA': 4}
+
+# Lebar satu karakter SVG relatif terhadap ukuran font (font monospace)
+SVG_CHAR_WIDTH = 0.6
+
 # Fungsi untuk mendapatkan lebar terminal
 def get_terminal_width():
     """
@@ -36,6 +73,24 @@ def get_terminal_width():
         except:
             return 80
 
+
+# Fungsi untuk mendapatkan ukuran terminal (kolom dan baris)
+def get_terminal_size():
+    """
+    Mendapatkan ukuran terminal saat ini
+    
+    Returns:
+        Tuple (kolom, baris) (default: 80 x 24 jika tidak bisa dideteksi)
+    """
+    try:
+        terminal_size = shutil.get_terminal_size()
+        return terminal_size.columns, terminal_size.lines
+    except:
+        try:
+            return int(os.environ.get('COLUMNS', 80)), int(os.environ.get('LINES', 24))
+        except:
+            return 80, 24
+
 # Fungsi untuk mengonversi piksel grayscale menjadi karakter ASCII
 def pixel_to_ascii(pixel_value):
     """
@@ -48,8 +103,250 @@ def pixel_to_ascii(pixel_value):
     return ASCII_CHARS[ascii_index]
 
 
+# Lookup table bersama: nilai piksel (0-255) -> indeks karakter ASCII
+# Dihitung sekali dari pixel_to_ascii dan dipakai ulang untuk semua gambar/frame
+ASCII_LUT = np.array([ASCII_CHARS.index(pixel_to_ascii(v)) for v in range(256)], dtype=np.uint8)
+ASCII_CHAR_ARRAY = np.array(list(ASCII_CHARS))
+
+
+# Fungsi untuk menghitung ukuran grid ASCII dari ukuran gambar
+def ascii_grid_size(original_width, original_height, width, cell_aspect=CELL_ASPECT):
+    """
+    Menghitung ukuran grid ASCII berdasarkan rasio aspect gambar
+    
+    Args:
+        original_width: Lebar gambar sumber (piksel)
+        original_height: Tinggi gambar sumber (piksel)
+        width: Lebar output ASCII (jumlah karakter)
+        cell_aspect: Rasio lebar/tinggi sel karakter
+    
+    Returns:
+        Tuple (jumlah kolom, jumlah baris)
+    """
+    aspect_ratio = original_height / original_width
+    return width, max(1, int(width * aspect_ratio * cell_aspect))
+
+
+# Fungsi untuk menghitung batas piksel sumber setiap sel
+def _cell_edges(src_size, dst_size):
+    # Sel ke-i mencakup piksel [start, end), minimal satu piksel (saat upscale)
+    start = np.arange(dst_size) * src_size // dst_size
+    end = np.maximum((np.arange(dst_size) + 1) * src_size // dst_size, start + 1)
+    return start, end
+
+
+# Fungsi untuk menjumlahkan pita baris [start, end) dari array piksel
+def _sum_row_bands(pixels, starts, ends):
+    # uint16 cukup selama satu pita tidak lebih dari 257 baris (257 * 255 < 65536)
+    dtype = np.uint16 if len(starts) and (ends - starts).max() <= 257 else np.uint32
+    sums = np.empty((len(starts),) + pixels.shape[1:], dtype=dtype)
+    for index, (start, end) in enumerate(zip(starts, ends)):
+        np.sum(pixels[start:end], axis=0, dtype=dtype, out=sums[index])
+    return sums
+
+
+class ResizePlan:
+    """
+    Parameter downsampling untuk satu ukuran sumber -> ukuran grid.
+    Batas area setiap sel dan tabel indeks sampling dihitung sekali saat plan
+    dibuat, lalu dipakai ulang untuk setiap frame berukuran sama
+    (lihat get_resize_plan).
+    
+    Args:
+        src_height, src_width: Ukuran gambar sumber (piksel)
+        rows, cols: Ukuran grid tujuan
+        strategy: Salah satu dari RESIZE_STRATEGIES
+    """
+    
+    def __init__(self, src_height, src_width, rows, cols, strategy=DEFAULT_RESIZE):
+        if strategy not in RESIZE_STRATEGIES:
+            raise ValueError(f"Strategi resize tidak dikenal: {strategy} "
+                             f"(pilihan: {', '.join(RESIZE_STRATEGIES)})")
+        
+        self.src_height, self.src_width = src_height, src_width
+        self.rows, self.cols = rows, cols
+        self.strategy = strategy
+        
+        # Batas piksel sumber setiap baris/kolom sel (area dan box)
+        self.row_start, self.row_end = _cell_edges(src_height, rows)
+        self.col_start, self.col_end = _cell_edges(src_width, cols)
+        cell_count = np.outer(self.row_end - self.row_start, self.col_end - self.col_start)
+        
+        # Jumlah piksel satu sel muat di uint32 selama sel < 2^32 / 255 (~16.8 juta piksel);
+        # sel yang lebih besar (gambar sangat besar ke grid kecil) dijumlahkan dengan uint64
+        self.sum_dtype = np.uint64 if int(cell_count.max()) * 255 >= 2 ** 32 else np.uint32
+        self.cell_count = cell_count.astype(self.sum_dtype)
+        
+        # Tabel indeks piksel tengah setiap sel (stride)
+        self.row_center = (self.row_start + self.row_end - 1) // 2
+        self.col_center = (self.col_start + self.col_end - 1) // 2
+    
+    @property
+    def supports_regions(self):
+        """Apakah sebagian grid bisa dihitung tanpa memproses seluruh gambar"""
+        return self.strategy != 'lanczos'
+    
+    def resize(self, pixels, rows=None, cols=None):
+        """
+        Me-resize array piksel (tinggi x lebar atau tinggi x lebar x channel) ke ukuran grid
+        
+        Args:
+            pixels: Array uint8 berukuran sama dengan sumber plan
+            rows: Tuple (baris awal, baris akhir) grid yang dihitung (opsional)
+            cols: Tuple (kolom awal, kolom akhir) grid yang dihitung (opsional)
+        
+        Returns:
+            Array uint8 berukuran (baris, kolom[, channel])
+        """
+        row0, row1 = rows if rows is not None else (0, self.rows)
+        col0, col1 = cols if cols is not None else (0, self.cols)
+        
+        if self.strategy == 'stride':
+            return pixels[np.ix_(self.row_center[row0:row1], self.col_center[col0:col1])]
+        
+        if self.strategy == 'lanczos':
+            resized = Image.fromarray(pixels).resize((self.cols, self.rows), Image.LANCZOS)
+            return np.array(resized)[row0:row1, col0:col1]
+        
+        # Hanya bagian gambar yang dicakup sel yang diminta yang diproses
+        y0, y1 = self.row_start[row0], self.row_end[row1 - 1]
+        x0, x1 = self.col_start[col0], self.col_end[col1 - 1]
+        block = pixels[y0:y1, x0:x1]
+        row_start, row_end = self.row_start[row0:row1] - y0, self.row_end[row0:row1] - y0
+        col_start, col_end = self.col_start[col0:col1] - x0, self.col_end[col0:col1] - x0
+        
+        if self.strategy == 'area':
+            # Jumlah baris setiap sel, lalu jumlah kolomnya
+            row_sums = _sum_row_bands(block, row_start, row_end)
+            sums = np.add.reduceat(row_sums, col_start, axis=1, dtype=self.sum_dtype)
+        else:
+            # Integral image (summed-area table), hanya dihitung pada baris batas sel:
+            # jumlah setiap kotak diambil dari empat sudutnya
+            row_edges, row_index = np.unique(np.concatenate([row_start, row_end]), return_inverse=True)
+            band_sums = _sum_row_bands(block, row_edges[:-1], row_edges[1:])
+            integral = np.zeros((len(row_edges), block.shape[1] + 1) + block.shape[2:],
+                                dtype=self.sum_dtype)
+            np.cumsum(band_sums, axis=0, dtype=self.sum_dtype, out=integral[1:, 1:])
+            np.cumsum(integral[1:, 1:], axis=1, out=integral[1:, 1:])
+            top, bottom = row_index[:len(row_start)], row_index[len(row_start):]
+            sums = (integral[np.ix_(bottom, col_end)] - integral[np.ix_(top, col_end)]
+                    - integral[np.ix_(bottom, col_start)] + integral[np.ix_(top, col_start)])
+        
+        counts = self.cell_count[row0:row1, col0:col1]
+        if block.ndim == 3:
+            counts = counts[:, :, None]
+        return ((sums + counts // 2) // counts).astype(np.uint8)
+
+
+# Fungsi untuk mendapatkan plan resize (di-cache per ukuran sumber dan grid)
+@functools.lru_cache(maxsize=16)
+def get_resize_plan(src_height, src_width, rows, cols, strategy=DEFAULT_RESIZE):
+    """
+    Mengembalikan ResizePlan yang di-cache, sehingga parameter resize
+    hanya dihitung sekali untuk setiap resolusi dalam satu stream
+    """
+    return ResizePlan(src_height, src_width, rows, cols, strategy)
+
+
+# Fungsi untuk me-resize array piksel ke ukuran grid
+def resize_pixels(pixels, cols, rows, strategy=DEFAULT_RESIZE):
+    """
+    Me-resize array piksel ke ukuran grid ASCII dengan strategi tertentu
+    
+    Args:
+        pixels: Array uint8 (tinggi x lebar atau tinggi x lebar x channel)
+        cols: Jumlah kolom grid
+        rows: Jumlah baris grid
+        strategy: Salah satu dari RESIZE_STRATEGIES
+    
+    Returns:
+        Array uint8 berukuran (rows, cols[, channel])
+    """
+    plan = get_resize_plan(pixels.shape[0], pixels.shape[1], rows, cols, strategy)
+    return plan.resize(pixels)
+
+
+# Fungsi untuk mengonversi satu frame menjadi grid indeks karakter
+def frame_to_grid(frame, width, ascii_height, use_color=False, resize_strategy=DEFAULT_RESIZE):
+    """
+    Mengonversi satu frame (PIL Image) menjadi grid indeks karakter ASCII
+    menggunakan lookup table (tanpa loop per piksel)
+    
+    Args:
+        frame: PIL Image (frame tunggal)
+        width: Lebar output ASCII (jumlah karakter)
+        ascii_height: Tinggi output ASCII (jumlah baris)
+        use_color: Apakah juga mengembalikan warna RGB per karakter
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+    
+    Returns:
+        Tuple (grid indeks karakter uint8, array RGB uint8 atau None)
+    """
+    rgb_pixels = None
+    if use_color:
+        # Resize sekali dalam RGB, grayscale diambil dari hasil resize
+        rgb_pixels = resize_pixels(np.asarray(frame.convert('RGB')), width, ascii_height, resize_strategy)
+        gray_pixels = np.asarray(Image.fromarray(rgb_pixels).convert('L'))
+    else:
+        gray_pixels = resize_pixels(np.asarray(frame.convert('L')), width, ascii_height, resize_strategy)
+    
+    return ASCII_LUT[gray_pixels], rgb_pixels
+
+
+# Fungsi untuk mengubah grid indeks karakter menjadi string ASCII art
+def grid_to_ascii(char_grid, rgb_pixels=None):
+    """
+    Menyusun string ASCII art dari grid indeks karakter
+    
+    Args:
+        char_grid: Array 2D indeks karakter (hasil frame_to_grid)
+        rgb_pixels: Array RGB per karakter (opsional, untuk ANSI escape code)
+    
+    Returns:
+        String ASCII art
+    """
+    char_rows = ASCII_CHAR_ARRAY[char_grid].tolist()
+    
+    if rgb_pixels is None:
+        return "".join("".join(row) + "\n" for row in char_rows)
+    
+    lines = []
+    for char_row, color_row in zip(char_rows, rgb_pixels.tolist()):
+        # Menggunakan ANSI escape code untuk RGB color
+        line = "".join(f"\033[38;2;{r};{g};{b}m{char}"
+                       for char, (r, g, b) in zip(char_row, color_row))
+        lines.append(line + "\033[0m\n")  # Reset color setelah setiap baris
+    return "".join(lines)
+
+
+# Fungsi untuk mengonversi gambar menjadi grid indeks karakter
+def image_to_grid(image_path, width=80, use_color=False, resize_strategy=DEFAULT_RESIZE,
+                  cell_aspect=CELL_ASPECT):
+    """
+    Mengonversi file gambar menjadi grid indeks karakter (untuk export terstruktur)
+    
+    Args:
+        image_path: Path ke file gambar
+        width: Lebar output ASCII (jumlah karakter)
+        use_color: Apakah juga mengembalikan warna RGB per karakter
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
+    
+    Returns:
+        Tuple (grid indeks karakter uint8, array RGB uint8 atau None)
+    """
+    # Membuka gambar menggunakan Pillow
+    image = Image.open(image_path)
+    
+    # Menghitung tinggi ASCII berdasarkan rasio aspect gambar dan sel karakter
+    width, ascii_height = ascii_grid_size(*image.size, width, cell_aspect)
+    
+    return frame_to_grid(image, width, ascii_height, use_color, resize_strategy)
+
+
 # Fungsi untuk mengonversi gambar menjadi ASCII art
-def image_to_ascii(image_path, width=80, use_color=False):
+def image_to_ascii(image_path, width=80, use_color=False, resize_strategy=DEFAULT_RESIZE,
+                   cell_aspect=CELL_ASPECT):
     """
     Mengonversi file gambar menjadi teks ASCII art
     
@@ -57,51 +354,16 @@ def image_to_ascii(image_path, width=80, use_color=False):
         image_path: Path ke file gambar
         width: Lebar output ASCII (jumlah karakter)
         use_color: Apakah ingin menggunakan warna (RGB)
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
     
     Returns:
         String ASCII art dari gambar
     """
     try:
-        # Membuka gambar menggunakan Pillow
-        image = Image.open(image_path)
-        
-        # Mendapatkan dimensi gambar
-        original_width, original_height = image.size
-        
-        # Menghitung tinggi ASCII berdasarkan rasio aspect
-        aspect_ratio = original_height / original_width
-        ascii_height = int(width * aspect_ratio * 0.55)  # * 0.55 karena karakter lebih tinggi daripada lebar
-        
         # Mengonversi gambar menjadi ASCII art dengan warna atau grayscale
-        if use_color:
-            # Versi berwarna dengan ANSI escape code
-            rgb_image = image.convert('RGB')
-            rgb_pixels = np.array(rgb_image.resize((width, ascii_height)))
-            
-            # Juga resize untuk grayscale untuk karakter ASCII
-            gray_image = image.convert('L')
-            gray_pixels = np.array(gray_image.resize((width, ascii_height)))
-            
-            ascii_art = ""
-            for y in range(ascii_height):
-                for x in range(width):
-                    r, g, b = rgb_pixels[y, x]
-                    pixel_value = gray_pixels[y, x]
-                    char = pixel_to_ascii(pixel_value)
-                    # Menggunakan ANSI escape code untuk RGB color
-                    ascii_art += f"\033[38;2;{r};{g};{b}m{char}"
-                ascii_art += "\033[0m\n"  # Reset color setelah setiap baris
-        else:
-            # Versi grayscale biasa
-            gray_image = image.convert('L')
-            resized_image = gray_image.resize((width, ascii_height))
-            pixels = np.array(resized_image)
-            
-            ascii_art = ""
-            for row in pixels:
-                for pixel in row:
-                    ascii_art += pixel_to_ascii(pixel)
-                ascii_art += "\n"  # Baris baru setelah setiap row
+        char_grid, rgb_pixels = image_to_grid(image_path, width, use_color, resize_strategy, cell_aspect)
+        ascii_art = grid_to_ascii(char_grid, rgb_pixels)
         
         return ascii_art
     
@@ -192,21 +454,22 @@ def convert_ansi_to_html(ascii_art):
     return '<br>\n'.join(html_lines)
 
 
-# Fungsi untuk menyimpan ASCII art ke file HTML (dengan warna)
-def save_ascii_to_html(ascii_art, output_path):
+# Fungsi untuk membuat awal dokumen HTML (sampai tag <body>)
+def _html_document_head(colored=False):
     """
-    Menyimpan ASCII art ke file HTML
+    Membuat bagian awal dokumen HTML: background hitam dan font monospace
     
     Args:
-        ascii_art: String ASCII art (dengan atau tanpa ANSI escape codes)
-        output_path: Path untuk file output HTML
+        colored: Apakah isi berupa span berwarna (warna default span putih)
+    
+    Returns:
+        String HTML sampai dengan tag <body>
     """
-    try:
-        # Jika ada ANSI escape codes, konversi ke HTML dengan span
-        if '\033[' in ascii_art:
-            # Konversi ANSI ke HTML dengan span berwarna
-            html_content = convert_ansi_to_html(ascii_art)
-            html = f"""<!DOCTYPE html>
+    span_style = """
+        span {
+            color: white;
+        }""" if colored else ""
+    return f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset='utf-8'>
@@ -219,38 +482,37 @@ def save_ascii_to_html(ascii_art, output_path):
             white-space: pre;
             margin: 20px;
             line-height: 1;
-        }}
-        span {{
-            color: white;
-        }}
+        }}{span_style}
     </style>
 </head>
 <body>
-{html_content}
+"""
+
+
+# Akhir dokumen HTML
+HTML_DOCUMENT_TAIL = """
 </body>
 </html>"""
+
+
+# Fungsi untuk menyimpan ASCII art ke file HTML (dengan warna)
+def save_ascii_to_html(ascii_art, output_path):
+    """
+    Menyimpan ASCII art ke file HTML
+    
+    Args:
+        ascii_art: String ASCII art (dengan atau tanpa ANSI escape codes)
+        output_path: Path untuk file output HTML
+    """
+    try:
+        # Jika ada ANSI escape codes, konversi ke HTML dengan span
+        if '\033[' in ascii_art:
+            # Konversi ANSI ke HTML dengan span berwarna
+            html_content = convert_ansi_to_html(ascii_art)
+            html = _html_document_head(colored=True) + html_content + HTML_DOCUMENT_TAIL
         else:
             # Grayscale, normal HTML
-            html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset='utf-8'>
-    <title>ASCII Art</title>
-    <style>
-        body {{
-            background: black;
-            color: white;
-            font-family: 'Consolas', 'Courier New', monospace;
-            white-space: pre;
-            margin: 20px;
-            line-height: 1;
-        }}
-    </style>
-</head>
-<body>
-<pre>{ascii_art}</pre>
-</body>
-</html>"""
+            html = _html_document_head() + f"<pre>{ascii_art}</pre>" + HTML_DOCUMENT_TAIL
         
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(html)
@@ -259,9 +521,746 @@ def save_ascii_to_html(ascii_art, output_path):
         print(f"Error saat menyimpan file HTML: {str(e)}")
 
 
+# Fungsi untuk menghitung run (nilai berurutan yang sama) pada setiap baris grid
+def _row_runs(values):
+    """
+    Menghitung run-length encoding untuk setiap baris array 2D
+    (run tidak pernah melewati batas baris)
+    
+    Args:
+        values: Array 2D (baris x kolom)
+    
+    Returns:
+        List per baris berisi tuple (array kolom awal run, array panjang run)
+    """
+    rows, cols = values.shape
+    # Run baru dimulai di awal baris atau saat nilai berbeda dengan kolom sebelumnya
+    run_start = np.ones(values.shape, dtype=bool)
+    run_start[:, 1:] = values[:, 1:] != values[:, :-1]
+    starts = np.flatnonzero(run_start)
+    lengths = np.diff(np.append(starts, rows * cols))
+    
+    # Pisahkan per baris berdasarkan jumlah run di setiap baris
+    split_at = np.cumsum(run_start.sum(axis=1))[:-1]
+    return list(zip(np.split(starts % cols, split_at), np.split(lengths, split_at)))
+
+
+# Fungsi untuk mengemas warna RGB menjadi satu bilangan 0xRRGGBB per sel
+def _pack_rgb(rgb_pixels):
+    rgb = rgb_pixels.astype(np.uint32)
+    return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+
+# Fungsi untuk mengubah grid menjadi format biner ASCII grid
+def grid_to_bytes(char_grid, rgb_pixels=None):
+    """
+    Mengubah grid indeks karakter (dan warna) menjadi format biner ringkas:
+    header 16 byte, karakter ASCII_CHARS, lalu grid uint8 (baris x kolom)
+    dan grid RGB uint8 (baris x kolom x 3) jika berwarna
+    
+    Args:
+        char_grid: Array 2D indeks karakter (hasil frame_to_grid)
+        rgb_pixels: Array RGB per karakter (opsional)
+    
+    Returns:
+        Bytes dalam format ASCII grid
+    """
+    rows, cols = char_grid.shape
+    chars = ASCII_CHARS.encode('utf-8')
+    flags = GRID_FLAG_COLOR if rgb_pixels is not None else 0
+    header = struct.pack(GRID_HEADER_FORMAT, GRID_MAGIC, GRID_VERSION, flags, len(chars), rows, cols)
+    
+    # Data grid dimulai di kelipatan 16 byte
+    header += chars + b'\0' * (-(len(header) + len(chars)) % 16)
+    parts = [header, np.ascontiguousarray(char_grid, dtype=np.uint8).tobytes()]
+    if rgb_pixels is not None:
+        parts.append(np.ascontiguousarray(rgb_pixels, dtype=np.uint8).tobytes())
+    return b''.join(parts)
+
+
+# Fungsi untuk memuat file/bytes ASCII grid tanpa menyalin data
+def load_ascii_grid(source):
+    """
+    Memuat ASCII grid dari file (memory-mapped) atau dari bytes (np.frombuffer).
+    Grid yang dikembalikan adalah view read-only ke data asli, tanpa salinan.
+    
+    Args:
+        source: Path file .agrid atau objek bytes/bytearray/memoryview
+    
+    Returns:
+        Tuple (grid indeks karakter, array RGB atau None, string karakter ASCII)
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = np.frombuffer(source, dtype=np.uint8)
+    else:
+        data = np.memmap(source, dtype=np.uint8, mode='r')
+    
+    header_size = struct.calcsize(GRID_HEADER_FORMAT)
+    magic, version, flags, chars_len, rows, cols = struct.unpack(
+        GRID_HEADER_FORMAT, data[:header_size].tobytes())
+    if magic != GRID_MAGIC or version != GRID_VERSION:
+        raise ValueError("Bukan file ASCII grid yang valid")
+    
+    chars = data[header_size:header_size + chars_len].tobytes().decode('utf-8')
+    offset = header_size + chars_len
+    offset += -offset % 16
+    
+    cells = rows * cols
+    char_grid = data[offset:offset + cells].reshape(rows, cols)
+    rgb_pixels = None
+    if flags & GRID_FLAG_COLOR:
+        rgb_pixels = data[offset + cells:offset + cells * 4].reshape(rows, cols, 3)
+    return char_grid, rgb_pixels, chars
+
+
+# Fungsi untuk mengubah grid menjadi JSON dengan baris run-length encoded
+def grid_to_json(char_grid, rgb_pixels=None):
+    """
+    Mengubah grid indeks karakter (dan warna) menjadi JSON ringkas.
+    Setiap baris disimpan sebagai [karakter setiap run, [panjang run, ...]],
+    misalnya ["@%.", [3, 1, 76]]. Warna di-run terpisah dari karakter dan
+    disimpan sebagai ["rrggbb" setiap run (hex tanpa pemisah), [panjang run, ...]].
+    
+    Args:
+        char_grid: Array 2D indeks karakter (hasil frame_to_grid)
+        rgb_pixels: Array RGB per karakter (opsional)
+    
+    Returns:
+        String JSON
+    """
+    rows, cols = char_grid.shape
+    document = {
+        'format': 'ascii-grid',
+        'version': GRID_VERSION,
+        'width': cols,
+        'height': rows,
+        'chars': ASCII_CHARS,
+        'rows': [["".join(ASCII_CHAR_ARRAY[row[starts]].tolist()), lengths.tolist()]
+                 for row, (starts, lengths) in zip(char_grid, _row_runs(char_grid))],
+    }
+    
+    if rgb_pixels is not None:
+        document['colors'] = [[row[starts].tobytes().hex(), lengths.tolist()]
+                              for row, (starts, lengths) in zip(rgb_pixels, _row_runs(_pack_rgb(rgb_pixels)))]
+    
+    return json.dumps(document, separators=(',', ':'))
+
+
+# Fungsi untuk mengubah JSON (hasil grid_to_json) kembali menjadi grid
+def json_to_grid(json_text):
+    """
+    Mengubah JSON run-length encoded kembali menjadi grid
+    
+    Args:
+        json_text: String JSON hasil grid_to_json
+    
+    Returns:
+        Tuple (grid indeks karakter uint8, array RGB uint8 atau None)
+    """
+    document = json.loads(json_text)
+    shape = (document['height'], document['width'])
+    
+    # Karakter semua run digabung, lalu dipetakan ke indeks ASCII_CHARS sekaligus
+    charset = np.frombuffer(document['chars'].encode('utf-32-le'), dtype=np.uint32)
+    run_chars = np.frombuffer("".join(text for text, _ in document['rows']).encode('utf-32-le'),
+                              dtype=np.uint32)
+    order = np.argsort(charset)
+    run_index = order[np.searchsorted(charset, run_chars, sorter=order)].astype(np.uint8)
+    run_lengths = np.concatenate([lengths for _, lengths in document['rows']])
+    char_grid = np.repeat(run_index, run_lengths).reshape(shape)
+    
+    rgb_pixels = None
+    if 'colors' in document:
+        run_colors = np.frombuffer(bytes.fromhex("".join(hexes for hexes, _ in document['colors'])),
+                                   dtype=np.uint8).reshape(-1, 3)
+        run_lengths = np.concatenate([lengths for _, lengths in document['colors']])
+        rgb_pixels = np.repeat(run_colors, run_lengths, axis=0).reshape(shape + (3,))
+    
+    return char_grid, rgb_pixels
+
+
+# Fungsi untuk mengubah grid menjadi SVG
+def grid_to_svg(char_grid, rgb_pixels=None, font_size=12):
+    """
+    Mengubah grid indeks karakter (dan warna) menjadi SVG. Setiap baris
+    menjadi satu <text>; karakter berurutan dengan warna sama digabung
+    dalam satu <tspan>. Spasi tidak terlihat sehingga ikut warna run sebelumnya.
+    
+    Args:
+        char_grid: Array 2D indeks karakter (hasil frame_to_grid)
+        rgb_pixels: Array RGB per karakter (opsional)
+        font_size: Ukuran font (px)
+    
+    Returns:
+        String SVG
+    """
+    rows, cols = char_grid.shape
+    char_width = font_size * SVG_CHAR_WIDTH
+    width, height = cols * char_width, rows * font_size
+    char_rows = ["".join(row) for row in ASCII_CHAR_ARRAY[char_grid].tolist()]
+    
+    lines = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:g}" height="{height:g}" '
+        f'viewBox="0 0 {width:g} {height:g}">',
+        '<rect width="100%" height="100%" fill="black"/>',
+        f'<g font-family="Consolas, \'Courier New\', monospace" font-size="{font_size}" '
+        f'fill="white" xml:space="preserve">',
+    ]
+    
+    if rgb_pixels is not None:
+        packed = _pack_rgb(rgb_pixels)
+        # Warna spasi disamakan dengan sel sebelumnya agar run tidak terputus
+        visible = np.where(char_grid != ASCII_CHARS.index(' '), np.arange(cols), 0)
+        np.maximum.accumulate(visible, axis=1, out=visible)
+        packed = np.take_along_axis(packed, visible, axis=1)
+        color_runs = _row_runs(packed)
+    
+    for y, text in enumerate(char_rows):
+        attrs = f'x="0" y="{(y + 1) * font_size:g}" textLength="{width:g}" lengthAdjust="spacing"'
+        if rgb_pixels is None:
+            lines.append(f'<text {attrs}>{escape(text)}</text>')
+            continue
+        
+        starts, lengths = color_runs[y]
+        spans = "".join(f'<tspan fill="#{c:06x}">{escape(text[s:s + n])}</tspan>'
+                        for s, n, c in zip(starts.tolist(), lengths.tolist(),
+                                           packed[y, starts].tolist()))
+        lines.append(f'<text {attrs}>{spans}</text>')
+    
+    lines.append('</g>')
+    lines.append('</svg>')
+    return "\n".join(lines) + "\n"
+
+
+# Fungsi untuk menyimpan grid ke file biner ASCII grid
+def save_ascii_grid(char_grid, output_path, rgb_pixels=None):
+    """
+    Menyimpan grid ke file biner .agrid (bisa dimuat dengan load_ascii_grid)
+    
+    Args:
+        char_grid: Array 2D indeks karakter
+        output_path: Path untuk file output
+        rgb_pixels: Array RGB per karakter (opsional)
+    """
+    try:
+        with open(output_path, 'wb') as f:
+            f.write(grid_to_bytes(char_grid, rgb_pixels))
+        print(f"ASCII grid disimpan ke: {output_path}")
+    except Exception as e:
+        print(f"Error saat menyimpan file grid: {str(e)}")
+
+
+# Fungsi untuk menyimpan grid ke file JSON
+def save_ascii_to_json(char_grid, output_path, rgb_pixels=None):
+    """
+    Menyimpan grid ke file JSON dengan baris run-length encoded
+    
+    Args:
+        char_grid: Array 2D indeks karakter
+        output_path: Path untuk file output
+        rgb_pixels: Array RGB per karakter (opsional)
+    """
+    try:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(grid_to_json(char_grid, rgb_pixels))
+        print(f"ASCII art disimpan ke JSON: {output_path}")
+    except Exception as e:
+        print(f"Error saat menyimpan file JSON: {str(e)}")
+
+
+# Fungsi untuk memuat file JSON menjadi grid
+def load_ascii_json(input_path):
+    """
+    Memuat file JSON hasil save_ascii_to_json
+    
+    Args:
+        input_path: Path file JSON
+    
+    Returns:
+        Tuple (grid indeks karakter uint8, array RGB uint8 atau None)
+    """
+    with open(input_path, 'r', encoding='utf-8') as f:
+        return json_to_grid(f.read())
+
+
+# Fungsi untuk menyimpan grid ke file SVG
+def save_ascii_to_svg(char_grid, output_path, rgb_pixels=None, font_size=12):
+    """
+    Menyimpan grid ke file SVG
+    
+    Args:
+        char_grid: Array 2D indeks karakter
+        output_path: Path untuk file output
+        rgb_pixels: Array RGB per karakter (opsional)
+        font_size: Ukuran font (px)
+    """
+    try:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(grid_to_svg(char_grid, rgb_pixels, font_size))
+        print(f"ASCII art disimpan ke SVG: {output_path}")
+    except Exception as e:
+        print(f"Error saat menyimpan file SVG: {str(e)}")
+
+
+# Fungsi (context manager) untuk menonaktifkan batas ukuran gambar Pillow sementara
+@contextlib.contextmanager
+def _unlimited_image_pixels():
+    # Pillow menolak gambar > MAX_IMAGE_PIXELS (proteksi decompression bomb)
+    max_pixels = Image.MAX_IMAGE_PIXELS
+    Image.MAX_IMAGE_PIXELS = None
+    try:
+        yield
+    finally:
+        Image.MAX_IMAGE_PIXELS = max_pixels
+
+
+class ImageStripReader:
+    """
+    Membaca gambar per strip (beberapa baris penuh) tanpa memuat seluruh gambar.
+    Untuk format tanpa kompresi (PPM/PGM, BMP, TIFF tanpa kompresi, termasuk TIFF
+    bertile persegi) baris dibaca langsung dari file berdasarkan daftar tile Pillow,
+    sehingga memori hanya sebesar satu strip. Format lain (JPEG, PNG, TIFF LZW/Deflate,
+    ...) di-decode sekali secara utuh oleh Pillow (lihat decoded_bytes), lalu
+    dipotong dan dikonversi per strip; untuk JPEG ukuran decode bisa diperkecil
+    dengan draft().
+    
+    Args:
+        image_path: Path ke file gambar
+        mode: Mode strip yang dihasilkan ('L' atau 'RGB')
+        strip_bytes: Perkiraan ukuran maksimum satu strip (byte)
+    """
+    
+    def __init__(self, image_path, mode='L', strip_bytes=TILED_STRIP_BYTES):
+        with _unlimited_image_pixels():
+            self.image = Image.open(image_path)
+        self.image_path = image_path
+        self.mode = mode
+        self.strip_bytes = strip_bytes
+        self.layout = self._raw_layout()
+    
+    @property
+    def size(self):
+        """Ukuran gambar (lebar, tinggi) yang akan dibaca"""
+        return self.image.size
+    
+    @property
+    def streaming(self):
+        """Apakah gambar dibaca per strip langsung dari file"""
+        return self.layout is not None
+    
+    @property
+    def decoded_bytes(self):
+        """Perkiraan memori gambar yang di-decode utuh oleh Pillow (0 jika dibaca per strip)"""
+        if self.streaming:
+            return 0
+        # Pillow menyimpan mode 1/L/P dengan 1 byte, I;16 dengan 2 byte, selain itu 4 byte per piksel
+        mode = self.image.mode
+        pixel_bytes = 1 if mode in ('1', 'L', 'P') else 2 if mode.startswith('I;16') else 4
+        return self.size[0] * self.size[1] * pixel_bytes
+    
+    def _raw_layout(self):
+        # Tile 'raw' (strip selebar gambar maupun tile persegi) bisa dibaca per baris;
+        # tile dengan kompresi atau rawmode lain tidak
+        layout = []
+        rawmodes = set()
+        for codec, (x0, y0, x1, y1), offset, args in self.image.tile:
+            if isinstance(args, str):
+                args = (args,)
+            rawmode, stride, orientation = (tuple(args) + (0, 1))[:3]
+            if codec != 'raw' or rawmode not in RAW_STRIP_MODES:
+                return None
+            layout.append((y0, y1, x0, x1, offset, stride or (x1 - x0) * RAW_STRIP_MODES[rawmode],
+                           orientation))
+            rawmodes.add(rawmode)
+        
+        if len(rawmodes) != 1:
+            return None
+        self.rawmode = rawmodes.pop()
+        return sorted(layout)
+    
+    def draft(self, size):
+        """
+        Memperkecil ukuran decode (hanya JPEG) ke ukuran terkecil yang masih >= size.
+        Tidak berpengaruh untuk gambar yang dibaca per strip.
+        """
+        if not self.streaming:
+            self.image.draft(self.mode, size)
+    
+    def _read_rows(self, f, y, y_end):
+        # Membaca baris [y, y_end) dari semua tile yang mencakupnya (per baris tile,
+        # setiap tile hanya bagian barisnya), byte mentah di-decode oleh Pillow
+        # (urutan channel dan orientasi ditangani rawmode)
+        strip = np.empty((y_end - y, self.size[0]) + ((3,) if self.mode == 'RGB' else ()), dtype=np.uint8)
+        for y0, y1, x0, x1, offset, stride, orientation in self.layout:
+            start, end = max(y, y0), min(y_end, y1)
+            if start >= end:
+                continue
+            # Orientasi negatif (BMP): baris disimpan dari bawah ke atas
+            if orientation < 0:
+                f.seek(offset + (y1 - end) * stride)
+            else:
+                f.seek(offset + (start - y0) * stride)
+            part = Image.frombuffer(self.image.mode, (x1 - x0, end - start), f.read((end - start) * stride),
+                                    'raw', self.rawmode, stride, orientation)
+            strip[start - y:end - y, x0:x1] = self._convert(part)
+        
+        return strip
+    
+    def _convert(self, image):
+        # Menyesuaikan strip ke mode yang diminta (rumus konversi Pillow, sama dengan mode biasa)
+        if image.mode != self.mode:
+            image = image.convert(self.mode)
+        return np.asarray(image)
+    
+    def __iter__(self):
+        """Menghasilkan tuple (baris awal, array strip uint8) dari atas ke bawah"""
+        width, height = self.size
+        # Ukuran strip dihitung dari byte mentah per baris (bisa lebih besar dari hasil konversi)
+        row_bytes = width * (RAW_STRIP_MODES[self.rawmode] if self.streaming else 4)
+        strip_rows = max(1, self.strip_bytes // row_bytes)
+        
+        if self.streaming:
+            with open(self.image_path, 'rb') as f:
+                for y in range(0, height, strip_rows):
+                    yield y, self._read_rows(f, y, min(height, y + strip_rows))
+            return
+        
+        # Format terkompresi: Pillow men-decode sekali secara utuh, lalu setiap strip
+        # dipotong dan dikonversi sendiri agar tidak ada salinan kedua seukuran gambar
+        with _unlimited_image_pixels():
+            self.image.load()
+        for y in range(0, height, strip_rows):
+            yield y, self._convert(self.image.crop((0, y, width, min(height, y + strip_rows))))
+
+
+# Fungsi untuk mengonversi gambar per strip menjadi baris grid ASCII
+def iter_tiled_rows(reader, cols, rows, use_color=False):
+    """
+    Downsampling area per strip: jumlah piksel setiap baris grid diakumulasi
+    dari strip yang mencakupnya (baris sisa dibawa ke strip berikutnya), lalu
+    baris grid dihasilkan segera setelah seluruh areanya terbaca.
+    
+    Args:
+        reader: ImageStripReader (mode 'RGB' jika use_color, selain itu 'L')
+        cols, rows: Ukuran grid ASCII
+        use_color: Apakah juga menghasilkan warna RGB per karakter
+    
+    Returns:
+        Generator tuple (baris indeks karakter uint8, baris RGB uint8 atau None)
+    """
+    width, height = reader.size
+    plan = get_resize_plan(height, width, rows, cols, 'area')
+    
+    sums = {}
+    next_row = 0
+    for y, strip in reader:
+        y_end = y + len(strip)
+        
+        # Akumulasi jumlah kolom untuk setiap baris grid yang dicakup strip ini
+        row = next_row
+        while row < rows and plan.row_start[row] < y_end:
+            start, end = max(plan.row_start[row], y), min(plan.row_end[row], y_end)
+            if start < end:
+                band = strip[start - y:end - y].sum(axis=0, dtype=np.uint32)
+                sums[row] = sums[row] + band if row in sums else band
+            row += 1
+        
+        # Baris grid yang areanya sudah lengkap langsung dihasilkan
+        while next_row < rows and plan.row_end[next_row] <= y_end:
+            cell_sums = np.add.reduceat(sums.pop(next_row), plan.col_start, axis=0, dtype=np.uint64)
+            counts = plan.cell_count[next_row]
+            if use_color:
+                counts = counts[:, None]
+            cells = ((cell_sums + counts // 2) // counts).astype(np.uint8)
+            
+            if use_color:
+                gray = np.asarray(Image.fromarray(cells[None]).convert('L'))[0]
+                yield ASCII_LUT[gray], cells
+            else:
+                yield ASCII_LUT[cells], None
+            next_row += 1
+
+
+# Fungsi untuk mengubah satu baris grid menjadi HTML
+def _html_row(char_row, rgb_row=None):
+    # Karakter berurutan dengan warna sama digabung dalam satu span
+    text = "".join(ASCII_CHAR_ARRAY[char_row].tolist())
+    if rgb_row is None:
+        return escape(text)
+    starts, lengths = _row_runs(_pack_rgb(rgb_row[None]))[0]
+    return "".join(f'<span style="color: rgb({r},{g},{b});">{escape(text[s:s + n])}</span>'
+                   for s, n, (r, g, b) in zip(starts.tolist(), lengths.tolist(),
+                                              rgb_row[starts].tolist()))
+
+
+# Fungsi untuk mengecek apakah gambar memiliki lebih dari satu frame
+def is_animated_image(image_path):
+    """
+    Mengecek apakah file gambar berisi animasi / lebih dari satu frame
+    (misalnya GIF animasi, APNG, atau TIFF multi-halaman)
+    
+    Args:
+        image_path: Path ke file gambar
+    
+    Returns:
+        True jika gambar memiliki lebih dari satu frame
+    """
+    try:
+        with Image.open(image_path) as image:
+            return getattr(image, 'n_frames', 1) > 1
+    except Exception:
+        return False
+
+
+# Fungsi untuk membaca frame gambar animasi satu per satu
+def iter_frame_grids(image_path, width=80, use_color=False, resize_strategy=DEFAULT_RESIZE,
+                     cell_aspect=CELL_ASPECT):
+    """
+    Membaca frame gambar animasi secara lazy dengan ImageSequence dan
+    mengonversi setiap frame menjadi grid indeks karakter.
+    Hanya frame yang sedang diproses yang berada di memori.
+    
+    Args:
+        image_path: Path ke file gambar animasi
+        width: Lebar output ASCII (jumlah karakter)
+        use_color: Apakah juga menghasilkan warna RGB per karakter
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
+    
+    Yields:
+        Tuple (grid indeks karakter, array RGB atau None, durasi frame dalam ms)
+    """
+    with Image.open(image_path) as image:
+        # Ukuran grid dihitung sekali agar semua frame berukuran sama
+        width, ascii_height = ascii_grid_size(*image.size, width, cell_aspect)
+        
+        for frame in ImageSequence.Iterator(image):
+            duration = int(frame.info.get('duration') or DEFAULT_FRAME_DURATION)
+            char_grid, rgb_pixels = frame_to_grid(frame, width, ascii_height, use_color, resize_strategy)
+            yield char_grid, rgb_pixels, duration
+
+
+# Fungsi untuk membaca frame gambar animasi sebagai string ASCII art
+def iter_ascii_frames(image_path, width=80, use_color=False, resize_strategy=DEFAULT_RESIZE, cell_aspect=CELL_ASPECT):
+    """
+    Sama seperti iter_frame_grids, tetapi menghasilkan string ASCII art
+    
+    Yields:
+        Tuple (string ASCII art, durasi frame dalam ms)
+    """
+    for char_grid, rgb_pixels, duration in iter_frame_grids(image_path, width, use_color,
+                                                            resize_strategy, cell_aspect):
+        yield grid_to_ascii(char_grid, rgb_pixels), duration
+
+
+# Fungsi untuk memutar animasi ASCII di terminal
+def play_ascii_animation(image_path, width=80, use_color=False, loop=1,
+                         resize_strategy=DEFAULT_RESIZE, cell_aspect=CELL_ASPECT):
+    """
+    Memutar gambar animasi sebagai ASCII art di terminal sesuai durasi tiap frame
+    
+    Args:
+        image_path: Path ke file gambar animasi
+        width: Lebar ASCII art dalam karakter
+        use_color: Apakah menggunakan mode warna
+        loop: Jumlah pengulangan animasi (0 = ulang terus sampai Ctrl+C)
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
+    """
+    played = 0
+    try:
+        while loop == 0 or played < loop:
+            # Jadwal frame dihitung dari waktu absolut agar tidak terjadi drift
+            next_frame_time = time.perf_counter()
+            for ascii_art, duration in iter_ascii_frames(image_path, width, use_color,
+                                                         resize_strategy, cell_aspect):
+                # Pindahkan kursor ke kiri atas lalu bersihkan layar sebelum menggambar frame
+                sys.stdout.write("\033[H\033[J" + ascii_art)
+                sys.stdout.flush()
+                
+                next_frame_time += duration / 1000
+                delay = next_frame_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            played += 1
+    except KeyboardInterrupt:
+        print("\nAnimasi dihentikan")
+
+
+# Fungsi untuk menyimpan semua frame ASCII ke satu file teks
+def save_ascii_frames(image_path, output_path, width=80, use_color=False,
+                      resize_strategy=DEFAULT_RESIZE, cell_aspect=CELL_ASPECT):
+    """
+    Menyimpan urutan frame ASCII art ke file teks.
+    Setiap frame diawali baris header berisi nomor frame dan durasinya.
+    Frame ditulis satu per satu sehingga memori tidak bertambah untuk animasi panjang.
+    
+    Args:
+        image_path: Path ke file gambar animasi
+        output_path: Path untuk file output
+        width: Lebar ASCII art dalam karakter
+        use_color: Apakah menggunakan mode warna
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
+    """
+    try:
+        frame_count = 0
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for ascii_art, duration in iter_ascii_frames(image_path, width, use_color,
+                                                         resize_strategy, cell_aspect):
+                frame_count += 1
+                f.write(f"=== Frame {frame_count} | {duration} ms ===\n")
+                f.write(ascii_art)
+        print(f"{frame_count} frame ASCII berhasil disimpan ke: {output_path}")
+    except Exception as e:
+        print(f"Error saat menyimpan file: {str(e)}")
+
+
+# Fungsi untuk menyimpan animasi ASCII sebagai file GIF
+def save_ascii_gif(image_path, output_path, width=80, use_color=False, font_size=10,
+                   resize_strategy=DEFAULT_RESIZE, cell_aspect=CELL_ASPECT):
+    """
+    Me-render setiap frame ASCII menjadi gambar dan menulisnya sebagai GIF animasi.
+    Frame ditulis langsung ke file satu per satu (tidak dikumpulkan di memori),
+    dan semua frame memakai palet global yang sama (grayscale, atau palet web
+    untuk mode warna).
+    
+    Args:
+        image_path: Path ke file gambar animasi
+        output_path: Path untuk file output GIF
+        width: Lebar ASCII art dalam karakter
+        use_color: Apakah setiap karakter diwarnai sesuai warna aslinya
+        font_size: Ukuran font untuk render ASCII art
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
+    """
+    # Import di sini agar opencv hanya dibutuhkan saat menyimpan GIF
+    from video_to_ascii import render_ascii_grid
+    
+    try:
+        frame_count = 0
+        with open(output_path, 'wb') as f:
+            for char_grid, rgb_pixels, duration in iter_frame_grids(image_path, width, use_color,
+                                                                    resize_strategy, cell_aspect):
+                rendered = render_ascii_grid(char_grid, rgb_pixels, font_size)
+                if use_color:
+                    frame_image = Image.fromarray(rendered).convert('P', palette=Image.WEB, dither=Image.NONE)
+                else:
+                    frame_image = Image.fromarray(rendered[:, :, 0])
+                
+                if frame_count == 0:
+                    header, _ = GifImagePlugin.getheader(
+                        frame_image, info={'loop': 0, 'duration': duration, 'optimize': False})
+                    for block in header:
+                        f.write(block)
+                
+                for block in GifImagePlugin.getdata(frame_image, duration=duration):
+                    f.write(block)
+                frame_count += 1
+            
+            f.write(b';')  # GIF trailer
+        print(f"GIF ASCII ({frame_count} frame) berhasil disimpan ke: {output_path}")
+    except Exception as e:
+        print(f"Error saat menyimpan file GIF: {str(e)}")
+
+
+# Fungsi untuk mengonversi gambar animasi dengan pilihan output
+def convert_animation(image_path, width=80, save_to_file=False, output_path=None,
+                      use_color=False, simple_mode=False, save_gif=False, loop=1,
+                      resize_strategy=DEFAULT_RESIZE, cell_aspect=CELL_ASPECT,
+                      save_html=False, save_grid=False, save_json=False, save_svg=False):
+    """
+    Fungsi utama untuk mengonversi gambar animasi (GIF/APNG) menjadi ASCII art
+    
+    Args:
+        image_path: Path ke file gambar animasi
+        width: Lebar ASCII art dalam karakter
+        save_to_file: Simpan urutan frame ke file teks
+        output_path: Path untuk file output (opsional)
+        use_color: Apakah menggunakan mode warna
+        simple_mode: Mode sederhana tanpa header
+        save_gif: Simpan hasil sebagai GIF ASCII
+        loop: Jumlah pengulangan saat diputar di terminal (0 = terus)
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
+        save_html: Simpan frame pertama ke HTML
+        save_grid: Simpan frame pertama ke file biner .agrid
+        save_json: Simpan frame pertama ke JSON
+        save_svg: Simpan frame pertama ke SVG
+    """
+    base_name = os.path.splitext(os.path.basename(image_path))[0]
+    save_first_frame = save_html or save_grid or save_json or save_svg
+    
+    if not simple_mode:
+        with Image.open(image_path) as image:
+            n_frames = getattr(image, 'n_frames', 1)
+        print(f"Mengonversi gambar animasi: {image_path} ({n_frames} frame)")
+        print(f"Lebar ASCII: {width} karakter")
+        if use_color:
+            print("Mode: Berwarna (Color)")
+    
+    # Menyimpan urutan frame ke file teks jika diminta
+    if save_to_file:
+        if output_path is None or output_path.endswith(('.gif', '.html', '.agrid', '.json', '.svg')):
+            frames_output = f"{base_name}_ascii_frames.txt"
+        else:
+            frames_output = output_path
+        save_ascii_frames(image_path, frames_output, width, use_color, resize_strategy, cell_aspect)
+    
+    # Menyimpan ke GIF jika diminta
+    if save_gif:
+        if output_path and output_path.endswith('.gif'):
+            gif_output = output_path
+        else:
+            gif_output = f"{base_name}_ascii.gif"
+        save_ascii_gif(image_path, gif_output, width, use_color,
+                       resize_strategy=resize_strategy, cell_aspect=cell_aspect)
+    
+    # Format satu gambar (HTML, .agrid, JSON, SVG) diisi dari frame pertama
+    if save_first_frame:
+        char_grid, rgb_pixels, _ = next(iter_frame_grids(image_path, width, use_color,
+                                                         resize_strategy, cell_aspect))
+        if not simple_mode:
+            print("HTML/--grid/--json/--svg disimpan dari frame pertama animasi")
+        if save_html:
+            save_ascii_to_html(grid_to_ascii(char_grid, rgb_pixels), export_path(image_path, output_path, '.html'))
+        if save_grid:
+            save_ascii_grid(char_grid, export_path(image_path, output_path, '.agrid'), rgb_pixels)
+        if save_json:
+            save_ascii_to_json(char_grid, export_path(image_path, output_path, '.json'), rgb_pixels)
+        if save_svg:
+            save_ascii_to_svg(char_grid, export_path(image_path, output_path, '.svg'), rgb_pixels)
+    
+    # Tanpa output file: putar animasi di terminal
+    if not save_to_file and not save_gif and not save_first_frame:
+        play_ascii_animation(image_path, width, use_color, loop, resize_strategy, cell_aspect)
+
+
+# Fungsi untuk menentukan path file export
+def export_path(image_path, output_path, extension):
+    """
+    Menentukan path file export: output_path jika ekstensinya sesuai,
+    jika tidak <nama gambar>_ascii<ekstensi>
+    
+    Args:
+        image_path: Path ke file gambar
+        output_path: Path output dari argumen --output (bisa None)
+        extension: Ekstensi file export (misalnya '.html')
+    
+    Returns:
+        Path file export
+    """
+    if output_path and output_path.endswith(extension):
+        return output_path
+    base_name = os.path.splitext(os.path.basename(image_path))[0]
+    return f"{base_name}_ascii{extension}"
+
+
 # Fungsi untuk mengonversi gambar menjadi ASCII art dengan pilihan output
 def convert_image(image_path, width=80, save_to_file=False, output_path=None, 
-                  use_color=False, simple_mode=False, save_html=False):
+                  use_color=False, simple_mode=False, save_html=False,
+                  resize_strategy=DEFAULT_RESIZE, cell_aspect=CELL_ASPECT,
+                  save_grid=False, save_json=False, save_svg=False):
     """
     Fungsi utama untuk mengonversi gambar menjadi ASCII art
     
@@ -273,6 +1272,11 @@ def convert_image(image_path, width=80, save_to_file=False, output_path=None,
         use_color: Apakah menggunakan mode warna
         simple_mode: Mode sederhana tanpa header
         save_html: Apakah menyimpan ke HTML
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
+        save_grid: Apakah menyimpan ke file biner .agrid
+        save_json: Apakah menyimpan ke JSON
+        save_svg: Apakah menyimpan ke SVG
     """
     if not simple_mode:
         print(f"Mengonversi gambar: {image_path}")
@@ -280,12 +1284,16 @@ def convert_image(image_path, width=80, save_to_file=False, output_path=None,
         if use_color:
             print("Mode: Berwarna (Color)")
     
-    # Mengonversi gambar menjadi ASCII art
-    ascii_art = image_to_ascii(image_path, width, use_color)
-    
-    if ascii_art is None:
+    # Mengonversi gambar menjadi grid, lalu menjadi ASCII art
+    try:
+        char_grid, rgb_pixels = image_to_grid(image_path, width, use_color, resize_strategy, cell_aspect)
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        if isinstance(e, Image.DecompressionBombError):
+            print("Untuk gambar sangat besar gunakan --tiled (dengan --save dan/atau --html)")
         print("Gagal mengonversi gambar")
         return
+    ascii_art = grid_to_ascii(char_grid, rgb_pixels)
     
     # Menampilkan ASCII art di terminal
     if not simple_mode:
@@ -307,13 +1315,84 @@ def convert_image(image_path, width=80, save_to_file=False, output_path=None,
     
     # Menyimpan ke HTML jika diminta
     if save_html:
-        if output_path and output_path.endswith('.html'):
-            html_output = output_path
-        else:
-            base_name = os.path.splitext(os.path.basename(image_path))[0]
-            html_output = f"{base_name}_ascii.html"
+        save_ascii_to_html(ascii_art, export_path(image_path, output_path, '.html'))
+    
+    # Menyimpan ke format terstruktur jika diminta
+    if save_grid:
+        save_ascii_grid(char_grid, export_path(image_path, output_path, '.agrid'), rgb_pixels)
+    if save_json:
+        save_ascii_to_json(char_grid, export_path(image_path, output_path, '.json'), rgb_pixels)
+    if save_svg:
+        save_ascii_to_svg(char_grid, export_path(image_path, output_path, '.svg'), rgb_pixels)
+
+
+# Fungsi untuk mengonversi gambar sangat besar per strip langsung ke file
+def convert_image_tiled(image_path, width=80, output_path=None, use_color=False,
+                        save_to_file=True, save_html=False, cell_aspect=CELL_ASPECT,
+                        strip_bytes=TILED_STRIP_BYTES):
+    """
+    Mengonversi gambar sangat besar (scan, panorama) dengan memori terbatas:
+    gambar dibaca per strip dan setiap baris ASCII langsung ditulis ke file
+    teks/HTML. Downsampling selalu memakai strategi 'area'.
+    
+    Args:
+        image_path: Path ke file gambar
+        width: Lebar ASCII art dalam karakter (boleh ribuan untuk poster)
+        output_path: Path untuk file output (opsional)
+        use_color: Apakah menggunakan mode warna
+        save_to_file: Apakah menyimpan ke file teks
+        save_html: Apakah menyimpan ke HTML
+        cell_aspect: Rasio lebar/tinggi sel karakter
+        strip_bytes: Perkiraan ukuran maksimum satu strip (byte)
+    """
+    start_time = time.perf_counter()
+    try:
+        reader = ImageStripReader(image_path, 'RGB' if use_color else 'L', strip_bytes)
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        print("Gagal membuka gambar")
+        return
+    
+    # Ukuran grid dihitung dari ukuran asli, sebelum draft() memperkecil decode
+    cols, rows = ascii_grid_size(*reader.size, width, cell_aspect)
+    print(f"Mengonversi gambar besar: {image_path} ({reader.size[0]}x{reader.size[1]} piksel)")
+    print(f"Grid ASCII: {cols}x{rows} karakter")
+    reader.draft((cols, rows))
+    if not reader.streaming:
+        print(f"Format tidak bisa dibaca per strip: gambar di-decode utuh "
+              f"({reader.size[0]}x{reader.size[1]} piksel, ~{reader.decoded_bytes / 2 ** 20:.0f} MB), "
+              f"lalu dikonversi per strip (~{strip_bytes / 2 ** 20:.0f} MB)")
+    
+    outputs = []
+    try:
+        if save_to_file:
+            text_file = open(export_path(image_path, output_path, '.txt'), 'w', encoding='utf-8')
+            outputs.append(text_file)
+        if save_html:
+            html_file = open(export_path(image_path, output_path, '.html'), 'w', encoding='utf-8')
+            outputs.append(html_file)
+            html_file.write(_html_document_head(colored=use_color) + ("" if use_color else "<pre>"))
         
-        save_ascii_to_html(ascii_art, html_output)
+        for index, (char_row, rgb_row) in enumerate(iter_tiled_rows(reader, cols, rows, use_color)):
+            if save_to_file:
+                text_file.write(grid_to_ascii(char_row[None], None if rgb_row is None else rgb_row[None]))
+            if save_html:
+                html_file.write(_html_row(char_row, rgb_row) + "\n")
+            print(f"\rBaris {index + 1}/{rows}", end="", flush=True)
+        print()
+        
+        if save_html:
+            html_file.write(("" if use_color else "</pre>") + HTML_DOCUMENT_TAIL)
+    except Exception as e:
+        print(f"\nError: {str(e)}")
+        return
+    finally:
+        for f in outputs:
+            f.close()
+    
+    for f in outputs:
+        print(f"ASCII art disimpan ke: {f.name}")
+    print(f"Selesai dalam {time.perf_counter() - start_time:.1f} detik")
 
 
 # Fungsi main
@@ -326,6 +1405,10 @@ def main():
         print("Error: Harap sertakan path ke file gambar!")
         print("\nPenggunaan:")
         print("  python image_to_ascii.py <gambar.jpg> [lebar] [--full] [--color] [--simple] [--save] [--html] [--output file.txt]")
+        print("                           [--grid] [--json] [--svg] [--resize area|box|stride|lanczos] [--aspect 0.55]")
+        print("  python image_to_ascii.py <animasi.gif> [lebar] [--color] [--save] [--gif] [--loop N] [--output file]")
+        print("                           [--html] [--grid] [--json] [--svg]  (dari frame pertama)")
+        print("  python image_to_ascii.py <gambar_besar.tif> [lebar] --tiled [--color] [--save] [--html] [--output file]")
         print("\nContoh:")
         print("  python image_to_ascii.py foto.jpg")
         print("  python image_to_ascii.py foto.jpg 100")
@@ -334,7 +1417,12 @@ def main():
         print("  python image_to_ascii.py foto.jpg 80 --save")
         print("  python image_to_ascii.py foto.jpg 100 --save --output hasil.txt")
         print("  python image_to_ascii.py foto.jpg 80 --color --html")
+        print("  python image_to_ascii.py foto.jpg 80 --color --grid --json --svg")
         print("  python image_to_ascii.py foto.jpg --simple")
+        print("  python image_to_ascii.py foto.jpg 120 --resize lanczos --aspect 0.5")
+        print("  python image_to_ascii.py animasi.gif 80 --color --loop 0")
+        print("  python image_to_ascii.py animasi.gif 80 --gif")
+        print("  python image_to_ascii.py panorama.tif 2000 --tiled --color --html")
         return
     
     input_file = sys.argv[1]
@@ -351,7 +1439,15 @@ def main():
     use_color = False
     simple_mode = False
     save_html = False
+    save_grid = False
+    save_json = False
+    save_svg = False
     use_full_width = False
+    tiled = False
+    save_gif = False
+    loop = 1
+    resize_strategy = DEFAULT_RESIZE
+    cell_aspect = CELL_ASPECT
     
     i = 2
     while i < len(sys.argv):
@@ -376,24 +1472,70 @@ def main():
         # Cek apakah ini adalah flag --html
         elif arg == '--html':
             save_html = True
+        # Cek apakah ini adalah flag export terstruktur (--grid, --json, --svg)
+        elif arg == '--grid':
+            save_grid = True
+        elif arg == '--json':
+            save_json = True
+        elif arg == '--svg':
+            save_svg = True
         # Cek apakah ini adalah flag --full
         elif arg == '--full':
             use_full_width = True
+        # Cek apakah ini adalah flag --tiled (gambar sangat besar, per strip)
+        elif arg == '--tiled':
+            tiled = True
+        # Cek apakah ini adalah flag --gif (khusus gambar animasi)
+        elif arg == '--gif':
+            save_gif = True
+        # Cek apakah ini adalah flag --loop (khusus gambar animasi)
+        elif arg == '--loop' and i + 1 < len(sys.argv) and sys.argv[i + 1].isdigit():
+            loop = int(sys.argv[i + 1])
+            i += 1
+        # Cek apakah ini adalah flag --resize (strategi downsampling)
+        elif arg == '--resize' and i + 1 < len(sys.argv):
+            resize_strategy = sys.argv[i + 1]
+            i += 1
+        # Cek apakah ini adalah flag --aspect (rasio lebar/tinggi sel karakter)
+        elif arg == '--aspect' and i + 1 < len(sys.argv):
+            try:
+                cell_aspect = float(sys.argv[i + 1])
+            except ValueError:
+                print(f"Error: '{sys.argv[i + 1]}' bukan angka yang valid untuk --aspect")
+                return
+            i += 1
         
         i += 1
     
+    if resize_strategy not in RESIZE_STRATEGIES:
+        print(f"Error: Strategi resize '{resize_strategy}' tidak dikenal "
+              f"(pilihan: {', '.join(RESIZE_STRATEGIES)})")
+        return
+    
     # Jika --full digunakan, set width ke lebar terminal
     if use_full_width:
         terminal_w = get_terminal_width()
         # Gunakan penuh lebar terminal (jika save ke file, kurangi sedikit)
-        if save_to_file or save_html:
+        if save_to_file or save_html or save_grid or save_json or save_svg:
             width = max(40, terminal_w - 20)
         else:
             # Untuk output ke terminal, gunakan penuh
             width = max(40, terminal_w)
     
-    # Konversi gambar
-    convert_image(input_file, width, save_to_file, output_path, use_color, simple_mode, save_html)
+    # Gambar sangat besar dibaca per strip dan langsung ditulis ke file
+    if tiled:
+        if save_grid or save_json or save_svg:
+            print("Peringatan: --grid/--json/--svg tidak didukung dengan --tiled, diabaikan")
+        convert_image_tiled(input_file, width, output_path, use_color,
+                            save_to_file or not save_html, save_html, cell_aspect)
+    # Gambar animasi diproses per frame, gambar biasa dikonversi sekali
+    elif is_animated_image(input_file):
+        convert_animation(input_file, width, save_to_file, output_path, use_color,
+                          simple_mode, save_gif, loop, resize_strategy, cell_aspect,
+                          save_html, save_grid, save_json, save_svg)
+    else:
+        convert_image(input_file, width, save_to_file, output_path, use_color, simple_mode, save_html,
+                      resize_strategy, cell_aspect, save_grid, save_json, save_svg)
 
 
 # Jalankan fungsi main jika script dijalankan langsung
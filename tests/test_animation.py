@@ -0,0 +1,35 @@
+import numpy as np
+from PIL import Image
+
+import image_to_ascii
+
+
+def write_animation(path):
+    frames = [Image.fromarray(np.full((40, 60, 3), value, dtype=np.uint8)) for value in (0, 255)]
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=50)
+
+
+def test_animation_exports_first_frame(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_animation(tmp_path / "a.gif")
+    
+    image_to_ascii.convert_animation("a.gif", 20, simple_mode=True, save_html=True,
+                                     save_grid=True, save_json=True, save_svg=True)
+    
+    # Frame pertama hitam: semua karakter '@'
+    char_grid, _ = image_to_ascii.json_to_grid((tmp_path / "a_ascii.json").read_text())
+    assert (char_grid == 0).all()
+    char_grid, _, _ = image_to_ascii.load_ascii_grid(str(tmp_path / "a_ascii.agrid"))
+    assert (char_grid == 0).all()
+    assert "@" in (tmp_path / "a_ascii.html").read_text()
+    assert (tmp_path / "a_ascii.svg").exists()
+
+
+def test_main_passes_export_flags_for_animation(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_animation(tmp_path / "a.gif")
+    monkeypatch.setattr("sys.argv", ["image_to_ascii.py", "a.gif", "20", "--simple", "--html"])
+    
+    image_to_ascii.main()
+    
+    assert (tmp_path / "a_ascii.html").exists()
@@ -0,0 +1,89 @@
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pytest
+
+from image_to_ascii import (ASCII_CHAR_ARRAY, ASCII_CHARS, grid_to_bytes, grid_to_json, grid_to_svg,
+                            json_to_grid, load_ascii_grid)
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def random_grid(rows=9, cols=31, seed=0):
+    rng = np.random.default_rng(seed)
+    # Run panjang (karakter dan warna berulang) dan sel acak dalam satu grid
+    char_grid = np.repeat(rng.integers(0, len(ASCII_CHARS), (rows, cols // 3 + 1)), 3, axis=1)[:, :cols]
+    char_grid[::2] = rng.integers(0, len(ASCII_CHARS), (len(char_grid[::2]), cols))
+    rgb_pixels = np.repeat(rng.integers(0, 256, (rows, cols // 4 + 1, 3)), 4, axis=1)[:, :cols]
+    return char_grid.astype(np.uint8), rgb_pixels.astype(np.uint8)
+
+
+@pytest.mark.parametrize("use_color", [False, True])
+def test_bytes_round_trip_is_zero_copy(use_color):
+    char_grid, rgb_pixels = random_grid()
+    data = grid_to_bytes(char_grid, rgb_pixels if use_color else None)
+    
+    loaded_grid, loaded_rgb, chars = load_ascii_grid(data)
+    
+    assert chars == ASCII_CHARS
+    np.testing.assert_array_equal(loaded_grid, char_grid)
+    assert np.shares_memory(loaded_grid, np.frombuffer(data, dtype=np.uint8))
+    if use_color:
+        np.testing.assert_array_equal(loaded_rgb, rgb_pixels)
+        assert np.shares_memory(loaded_rgb, np.frombuffer(data, dtype=np.uint8))
+    else:
+        assert loaded_rgb is None
+
+
+@pytest.mark.parametrize("use_color", [False, True])
+def test_file_round_trip_is_memory_mapped(tmp_path, use_color):
+    char_grid, rgb_pixels = random_grid()
+    path = tmp_path / "grid.agrid"
+    path.write_bytes(grid_to_bytes(char_grid, rgb_pixels if use_color else None))
+    
+    loaded_grid, loaded_rgb, _ = load_ascii_grid(str(path))
+    
+    np.testing.assert_array_equal(loaded_grid, char_grid)
+    assert isinstance(loaded_grid, np.memmap)
+    assert not loaded_grid.flags.writeable
+    if use_color:
+        np.testing.assert_array_equal(loaded_rgb, rgb_pixels)
+        assert isinstance(loaded_rgb, np.memmap)
+        assert np.shares_memory(loaded_grid.base, loaded_rgb)
+
+
+@pytest.mark.parametrize("use_color", [False, True])
+def test_json_round_trip(use_color):
+    char_grid, rgb_pixels = random_grid()
+    
+    loaded_grid, loaded_rgb = json_to_grid(grid_to_json(char_grid, rgb_pixels if use_color else None))
+    
+    np.testing.assert_array_equal(loaded_grid, char_grid)
+    if use_color:
+        np.testing.assert_array_equal(loaded_rgb, rgb_pixels)
+    else:
+        assert loaded_rgb is None
+
+
+@pytest.mark.parametrize("use_color", [False, True])
+def test_svg_is_valid_xml_with_grid_text(use_color):
+    char_grid, rgb_pixels = random_grid()
+    
+    root = ET.fromstring(grid_to_svg(char_grid, rgb_pixels if use_color else None, font_size=10))
+    texts = root.findall(f"{SVG}g/{SVG}text")
+    
+    assert root.tag == f"{SVG}svg"
+    assert [float(root.get("width")), float(root.get("height"))] == [31 * 6, 9 * 10]
+    assert ["".join(text.itertext()) for text in texts] == \
+        ["".join(row) for row in ASCII_CHAR_ARRAY[char_grid].tolist()]
+    
+    if use_color:
+        # Setiap karakter yang terlihat memakai warna selnya sendiri
+        for y, text in enumerate(texts):
+            x = 0
+            for span in text.findall(f"{SVG}tspan"):
+                for char in span.text:
+                    if char != ' ':
+                        assert span.get("fill") == "#" + rgb_pixels[y, x].tobytes().hex()
+                    x += 1
+            assert x == char_grid.shape[1]
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from video_to_ascii import ASCII_CHARS, AsciiFrameCache, bgr_frame_to_grid, render_ascii_grid
+
+
+def gradient_frame(height=480, width=640):
+    y, x = np.mgrid[0:height, 0:width]
+    return np.stack([x % 256, y % 256, (x + y) % 256], axis=-1).astype(np.uint8)
+
+
+def test_static_frame_is_skipped():
+    frame = gradient_frame()
+    cache = AsciiFrameCache(80)
+    cache.update(frame)
+    assert cache.update(frame.copy()) == 0
+    assert cache.frames_skipped == 1
+
+
+@pytest.mark.parametrize("block", [
+    (slice(150, 350), slice(150, 350)),  # blok besar, sel di tepinya hanya tertutup sebagian
+    (slice(240, 246), slice(320, 326)),  # perubahan kecil 6x6 piksel
+])
+@pytest.mark.parametrize("width", [80, 77])
+def test_localized_change_matches_full_conversion(block, width):
+    frame = gradient_frame()
+    cache = AsciiFrameCache(width)
+    cache.update(frame)
+    
+    changed = frame.copy()
+    changed[block] = 255
+    converted = cache.update(changed)
+    
+    expected_grid, expected_colors = bgr_frame_to_grid(changed, width)
+    assert converted > 0
+    assert converted < expected_grid.size
+    # Hanya tile di sekitar perubahan yang dikonversi ulang
+    assert cache.cells_skipped > expected_grid.size // 2
+    np.testing.assert_array_equal(cache.char_grid, expected_grid)
+    assert np.abs(cache.colors.astype(int) - expected_colors).max() <= cache.threshold
+    assert cache.ascii_art == "".join(
+        "".join(ASCII_CHARS[i] for i in row) + "\n" for row in expected_grid.tolist())
+
+
+@pytest.mark.parametrize("use_color", [False, True])
+def test_render_updates_only_changed_cells(use_color):
+    frame = gradient_frame()
+    cache = AsciiFrameCache(80)
+    cache.update(frame)
+    first = cache.render(use_color)
+    
+    changed = frame.copy()
+    changed[100:180, 200:260] = 0
+    cache.update(changed)
+    image = cache.render(use_color)
+    
+    assert image is not first
+    np.testing.assert_array_equal(
+        image, render_ascii_grid(cache.char_grid, cache.colors if use_color else None))
+    assert cache.render(use_color) is image
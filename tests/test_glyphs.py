@@ -0,0 +1,34 @@
+import cv2
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+import video_to_ascii
+
+
+@pytest.mark.parametrize("font_size", [6, 8, 10, 12, 16, 20])
+def test_glyph_masks_are_not_clipped(font_size):
+    masks = video_to_ascii.get_glyph_masks(font_size)
+    font = video_to_ascii.load_font(font_size)
+
+    for index, char in enumerate(video_to_ascii.ASCII_CHARS):
+        # Render referensi di kanvas besar agar tidak ada tinta yang terpotong
+        canvas = Image.new('L', (font_size * 3, font_size * 3), color=0)
+        ImageDraw.Draw(canvas).text((font_size, font_size), char, fill=255, font=font)
+        expected_ink = np.asarray(canvas, dtype=np.int64).sum()
+
+        assert masks[index].astype(np.int64).sum() == expected_ink, repr(char)
+
+
+@pytest.mark.parametrize("font_size", [8, 10, 16])
+def test_color_render_matches_masked_multiply(font_size):
+    rng = np.random.default_rng(font_size)
+    char_grid = rng.integers(0, len(video_to_ascii.ASCII_CHARS), (11, 13)).astype(np.uint8)
+    colors = rng.integers(0, 256, (11, 13, 3), dtype=np.uint8)
+
+    # Referensi: mask putih dikalikan warna sel yang diperbesar per piksel
+    white = video_to_ascii.render_ascii_grid(char_grid, None, font_size)
+    expanded = np.repeat(np.repeat(colors, font_size, axis=0), font_size, axis=1)
+    expected = cv2.multiply(expanded, white, scale=1 / 255)
+
+    assert np.array_equal(video_to_ascii.render_ascii_grid(char_grid, colors, font_size), expected)
@@ -0,0 +1,155 @@
+import re
+
+import numpy as np
+
+import video_to_ascii
+import webcam_ascii
+from webcam_ascii import FrameRateGovernor, fit_ascii_width, run_live_display
+
+STATUS = re.compile(r"Lebar (\d+) \| (\d+) fps")
+
+
+class FakeTerminal:
+    """Output palsu: mencatat (lebar, fps) setiap frame dan memajukan jam sesuai biaya frame"""
+    
+    def __init__(self, clock, cost):
+        self.clock = clock
+        self.cost = cost
+        self.frames = []
+    
+    def write(self, text):
+        match = STATUS.search(text)
+        if match:
+            width, fps = int(match.group(1)), int(match.group(2))
+            self.frames.append((width, fps))
+            self.clock.now += self.cost(len(self.frames), width)
+    
+    def flush(self):
+        pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def synthetic_source(height=48, width=64):
+    # Setiap frame berbeda agar selalu digambar ulang
+    rng = np.random.default_rng(0)
+    
+    def read_frame():
+        return True, rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    return read_frame
+
+
+def run(cost, get_size, max_frames, target_fps=30, clock=None):
+    clock = clock or FakeClock()
+    terminal = FakeTerminal(clock, cost)
+    stats = run_live_display(synthetic_source(), target_fps=target_fps, skip_unchanged=False,
+                             get_size=get_size, output=terminal, clock=clock, sleep=clock.sleep,
+                             max_frames=max_frames, use_signal=False)
+    return stats, terminal.frames
+
+
+def test_width_refits_after_terminal_resize():
+    # Terminal diperkecil setelah 1 detik; tanpa SIGWINCH ukuran dicek setiap 0.5 detik
+    clock = FakeClock()
+    stats, frames = run(lambda frame, width: 0.0,
+                        lambda: (120, 40) if clock.now < 1.0 else (60, 20), max_frames=60, clock=clock)
+    
+    assert stats['frames'] == 60
+    assert frames[0][0] == fit_ascii_width(64, 48, 120, 38)
+    assert frames[-1][0] == fit_ascii_width(64, 48, 60, 18)
+    assert frames[-1][0] < frames[0][0]
+
+
+def test_governor_lowers_width_then_fps_and_recovers():
+    # 300 frame pertama jauh melebihi budget, setelah itu hampir tanpa biaya
+    def cost(frame, width):
+        return 0.5 if frame <= 300 else 0.0001
+    
+    stats, frames = run(cost, lambda: (120, 40), max_frames=900)
+    widths = [width for width, _ in frames]
+    fps = [rate for _, rate in frames]
+    max_width = widths[0]
+    
+    # Beban berlebih: lebar turun sampai minimum sebelum frame rate diturunkan
+    first_fps_drop = next(i for i, rate in enumerate(fps) if rate < 30)
+    assert widths[first_fps_drop] == 20
+    assert all(b <= a for a, b in zip(widths[:300], widths[1:300]))
+    assert fps[299] == 5
+    
+    # Ada sisa waktu: frame rate kembali dulu, baru lebar
+    first_width_rise = next(i for i in range(300, len(widths)) if widths[i] > 20)
+    assert fps[first_width_rise] == 30
+    assert stats['fps'] == 30
+    assert stats['width'] == max_width
+
+
+def test_governor_follows_terminal_max_width():
+    governor = FrameRateGovernor(30, max_width=100)
+    governor.set_max_width(50)
+    assert governor.width == 50
+    governor.set_max_width(120)
+    assert governor.width == 120
+
+
+def test_show_webcam_handles_failed_first_read(monkeypatch, capsys):
+    class FailingCapture:
+        def __init__(self, index):
+            pass
+        
+        def isOpened(self):
+            return True
+        
+        def set(self, prop, value):
+            pass
+        
+        def read(self):
+            return False, None
+        
+        def release(self):
+            pass
+    
+    monkeypatch.setattr(webcam_ascii.cv2, 'VideoCapture', FailingCapture)
+    monkeypatch.setattr(webcam_ascii.cv2, 'destroyAllWindows', lambda: None)
+    webcam_ascii.show_webcam_ascii(0)
+    
+    out = capsys.readouterr().out
+    assert "Tidak bisa membaca frame" in out
+    assert "Kamera ditutup" in out
+
+
+class RecordingTerminal:
+    """Output palsu yang menyimpan semua teks yang ditulis"""
+    
+    def __init__(self):
+        self.text = ""
+    
+    def write(self, text):
+        self.text += text
+    
+    def flush(self):
+        pass
+
+
+def test_full_conversion_matches_frame_cache_text():
+    # Tanpa skip_unchanged teks disusun oleh frame_to_ascii (LUT), sama dengan mode cache
+    frame = np.random.default_rng(1).integers(0, 256, (48, 64, 3), dtype=np.uint8)
+    outputs = []
+    for skip_unchanged in (False, True):
+        clock = FakeClock()
+        terminal = RecordingTerminal()
+        run_live_display(lambda: (True, frame), target_fps=30, skip_unchanged=skip_unchanged,
+                         get_size=lambda: (80, 40), output=terminal, clock=clock, sleep=clock.sleep,
+                         max_frames=1, use_signal=False)
+        outputs.append(terminal.text)
+    
+    assert webcam_ascii.frame_to_ascii is video_to_ascii.frame_to_ascii
+    assert outputs[0] == outputs[1]
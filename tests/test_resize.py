@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from image_to_ascii import ResizePlan
+
+
+@pytest.mark.parametrize("strategy", ["area", "box"])
+def test_huge_cells_do_not_overflow(strategy):
+    # Satu sel 4200 x 4100 piksel: jumlahnya (~4.4e9) tidak muat di uint32
+    pixels = np.full((8400, 4100), 255, dtype=np.uint8)
+    pixels[4200:] = 100
+    plan = ResizePlan(8400, 4100, 2, 1, strategy)
+
+    assert plan.resize(pixels).tolist() == [[255], [100]]
+
+
+@pytest.mark.parametrize("strategy", ["area", "box"])
+def test_small_cells_keep_uint32_sums(strategy):
+    plan = ResizePlan(480, 640, 60, 160, strategy)
+    frame = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    expected = frame.reshape(60, 8, 160, 4, 3).mean(axis=(1, 3))
+
+    assert plan.cell_count.dtype == np.uint32
+    assert np.abs(plan.resize(frame) - expected).max() <= 0.5
+
+
+@pytest.mark.parametrize("strategy", ["area", "box", "stride"])
+def test_region_matches_full_resize(strategy):
+    frame = np.random.default_rng(1).integers(0, 256, (97, 131, 3), dtype=np.uint8)
+    plan = ResizePlan(97, 131, 33, 80, strategy)
+    
+    assert plan.supports_regions
+    np.testing.assert_array_equal(plan.resize(frame, rows=(3, 17), cols=(5, 41)),
+                                  plan.resize(frame)[3:17, 5:41])
@@ -0,0 +1,93 @@
+import struct
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from image_to_ascii import ImageStripReader, ascii_grid_size, image_to_grid, iter_tiled_rows
+
+
+def make_pixels(height, width, channels):
+    # Tekstur halus agar setiap sel punya rata-rata yang berbeda
+    y, x = np.mgrid[0:height, 0:width]
+    pixels = np.stack([(x * 7 + y * 3) % 256, (x * y) % 256, (x * 13 + y * 29) % 256], axis=-1)
+    pixels = pixels.astype(np.uint8)
+    return pixels if channels == 3 else pixels[..., 0]
+
+
+def save_tiled_tiff(path, pixels, tile=16):
+    # TIFF bertile tanpa kompresi (Pillow hanya bisa menulis TIFF per strip)
+    height, width = pixels.shape[:2]
+    channels = 1 if pixels.ndim == 2 else pixels.shape[2]
+    tiles = []
+    for y in range(0, height, tile):
+        for x in range(0, width, tile):
+            block = np.zeros((tile, tile) + pixels.shape[2:], dtype=np.uint8)
+            part = pixels[y:y + tile, x:x + tile]
+            block[:part.shape[0], :part.shape[1]] = part
+            tiles.append(block.tobytes())
+    
+    entries = 11
+    ifd_offset = 8
+    data_offset = ifd_offset + 2 + entries * 12 + 4
+    bits_offset = data_offset
+    offsets_offset = bits_offset + 2 * channels
+    counts_offset = offsets_offset + 4 * len(tiles)
+    tile_offset = counts_offset + 4 * len(tiles)
+    tile_offsets = [tile_offset + index * len(tiles[0]) for index in range(len(tiles))]
+    
+    def entry(tag, kind, count, value):
+        return struct.pack('<HHII', tag, kind, count, value)
+    
+    ifd = b''.join([
+        entry(256, 4, 1, width),
+        entry(257, 4, 1, height),
+        entry(258, 3, channels, 8 if channels == 1 else bits_offset),
+        entry(259, 3, 1, 1),
+        entry(262, 3, 1, 1 if channels == 1 else 2),
+        entry(277, 3, 1, channels),
+        entry(284, 3, 1, 1),
+        entry(322, 4, 1, tile),
+        entry(323, 4, 1, tile),
+        entry(324, 4, len(tiles), offsets_offset),
+        entry(325, 4, len(tiles), counts_offset),
+    ])
+    with open(path, 'wb') as f:
+        f.write(b'II*\x00' + struct.pack('<I', ifd_offset))
+        f.write(struct.pack('<H', entries) + ifd + struct.pack('<I', 0))
+        f.write(struct.pack(f'<{channels}H', *([8] * channels)))
+        f.write(struct.pack(f'<{len(tiles)}I', *tile_offsets))
+        f.write(struct.pack(f'<{len(tiles)}I', *([len(tiles[0])] * len(tiles))))
+        f.write(b''.join(tiles))
+
+
+FORMATS = {
+    'ppm': (3, True, lambda path, pixels: Image.fromarray(pixels).save(path)),
+    'pgm': (1, True, lambda path, pixels: Image.fromarray(pixels).save(path)),
+    'bmp': (3, True, lambda path, pixels: Image.fromarray(pixels).save(path)),
+    'tif': (3, True, lambda path, pixels: Image.fromarray(pixels).save(path, compression='raw')),
+    'tiled.tif': (3, True, save_tiled_tiff),
+    'gray-tiled.tif': (1, True, save_tiled_tiff),
+    'lzw.tif': (3, False, lambda path, pixels: Image.fromarray(pixels).save(path, compression='tiff_lzw')),
+    'png': (3, False, lambda path, pixels: Image.fromarray(pixels).save(path)),
+}
+
+
+@pytest.mark.parametrize("extension", list(FORMATS))
+@pytest.mark.parametrize("use_color", [False, True])
+@pytest.mark.parametrize("width", [23, 150])  # downscale dan upscale (lebar gambar 101)
+def test_tiled_rows_match_area_resize(tmp_path, extension, use_color, width):
+    channels, streaming, save = FORMATS[extension]
+    path = str(tmp_path / f"image.{extension}")
+    save(path, make_pixels(67, 101, channels))
+    
+    # Strip kecil: setiap baris grid tersebar di beberapa strip
+    reader = ImageStripReader(path, 'RGB' if use_color else 'L', strip_bytes=101 * 4 * 5)
+    assert reader.streaming == streaming
+    cols, rows = ascii_grid_size(*reader.size, width)
+    tiled = list(iter_tiled_rows(reader, cols, rows, use_color))
+    
+    expected_grid, expected_rgb = image_to_grid(path, width, use_color, 'area')
+    np.testing.assert_array_equal(np.stack([char_row for char_row, _ in tiled]), expected_grid)
+    if use_color:
+        np.testing.assert_array_equal(np.stack([rgb_row for _, rgb_row in tiled]), expected_rgb)
@@ -11,54 +11,226 @@ from PIL import Image, ImageDraw, ImageFont
 import os
 import sys
 
-# Mengatur karakter ASCII dari paling gelap hingga paling terang
-ASCII_CHARS = "@%#*+=-:. "
+from image_to_ascii import (ASCII_CHAR_ARRAY, ASCII_CHARS, ASCII_LUT, CELL_ASPECT, DEFAULT_RESIZE,
+                            RESIZE_STRATEGIES, ascii_grid_size, get_resize_plan, grid_to_ascii)
 
-# Fungsi untuk mengonversi piksel grayscale menjadi karakter ASCII
-def pixel_to_ascii(pixel_value):
+# Cache mask glyph per ukuran font (dirender sekali, dipakai untuk semua frame)
+_glyph_cache = {}
+
+# Cache tabel glyph berwarna per ukuran font (lihat get_glyph_levels)
+_glyph_level_cache = {}
+
+# Jumlah baris sel yang dirender sekaligus oleh render_ascii_grid
+RENDER_BAND_ROWS = 8
+
+# Deteksi perubahan: ambang selisih warna (0-255, per channel) agar sel dianggap berubah
+# (perubahan karakter selalu terdeteksi)
+CHANGE_THRESHOLD = 12
+
+# Probe murah sebelum konversi: frame diambil sampelnya setiap CHANGE_PROBE_STRIDE piksel,
+# dikelompokkan per tile CHANGE_TILE_SIZE x CHANGE_TILE_SIZE sel (batas tile = batas sel).
+# Tile dianggap berubah jika ada sampel yang bergeser lebih dari CHANGE_PROBE_PIXEL
+# atau rata-rata sampelnya bergeser lebih dari CHANGE_PROBE_MEAN (per channel)
+CHANGE_TILE_SIZE = 8
+CHANGE_PROBE_STRIDE = 4
+CHANGE_PROBE_PIXEL = 64
+CHANGE_PROBE_MEAN = 2
+
+
+# Fungsi untuk mengonversi frame menjadi grid indeks karakter
+def bgr_frame_to_grid(frame, width=80, resize_strategy=DEFAULT_RESIZE, cell_aspect=CELL_ASPECT):
     """
-    Mengonversi nilai piksel (0-255) menjadi karakter ASCII yang sesuai
-    Nilai lebih gelap -> karakter lebih "tebal" seperti @
-    Nilai lebih terang -> karakter lebih "tipis" seperti spasi
+    Mengonversi satu frame video menjadi grid indeks karakter ASCII
+    
+    Args:
+        frame: Frame video dalam format BGR
+        width: Lebar output ASCII (jumlah karakter)
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
+    
+    Returns:
+        Tuple (grid indeks karakter uint8, frame BGR yang sudah di-resize ke ukuran grid)
     """
-    # Menyesuaikan nilai piksel ke indeks karakter ASCII
-    ascii_index = int(pixel_value * (len(ASCII_CHARS) - 1) / 255)
-    return ASCII_CHARS[ascii_index]
+    # Mendapatkan dimensi frame
+    original_height, original_width = frame.shape[:2]
+    
+    # Menghitung tinggi ASCII berdasarkan rasio aspect
+    width, ascii_height = ascii_grid_size(original_width, original_height, width, cell_aspect)
+    
+    # Resize frame ke dimensi ASCII, warna tiap sel disimpan untuk render berwarna
+    # (plan resize di-cache per resolusi, jadi hanya dihitung sekali per stream)
+    plan = get_resize_plan(original_height, original_width, ascii_height, width, resize_strategy)
+    resized_frame = plan.resize(frame)
+    gray_frame = cv2.cvtColor(resized_frame, cv2.COLOR_BGR2GRAY)
+    
+    return ASCII_LUT[gray_frame], resized_frame
 
 
 # Fungsi untuk mengonversi frame menjadi ASCII art
-def frame_to_ascii(frame, width=80):
+def frame_to_ascii(frame, width=80, resize_strategy=DEFAULT_RESIZE, cell_aspect=CELL_ASPECT):
     """
     Mengonversi satu frame video menjadi teks ASCII art
     
     Args:
         frame: Frame video dalam format BGR
         width: Lebar output ASCII (jumlah karakter)
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
     
     Returns:
         String ASCII art dari frame
     """
-    # Mengonversi frame BGR menjadi grayscale
-    gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    char_grid, _ = bgr_frame_to_grid(frame, width, resize_strategy, cell_aspect)
+    return grid_to_ascii(char_grid)
+
+
+# Fungsi untuk memuat font monospace
+def load_font(font_size=10):
+    """
+    Mencari font monospace (Courier New / DejaVu Sans Mono) yang tersedia di sistem
     
-    # Mendapatkan dimensi frame
-    original_height, original_width = gray_frame.shape
+    Args:
+        font_size: Ukuran font
     
-    # Menghitung tinggi ASCII berdasarkan rasio aspect
-    aspect_ratio = original_height / original_width
-    ascii_height = int(width * aspect_ratio * 0.55)  # * 0.55 karena karakter lebih tinggi daripada lebar
+    Returns:
+        PIL ImageFont object
+    """
+    try:
+        # Mencari font yang tersedia di sistem
+        font_paths = [
+            "C:/Windows/Fonts/cour.ttf",  # Windows
+            "C:/Windows/Fonts/courbd.ttf",  # Windows Bold
+            "/System/Library/Fonts/Courier.ttc",  # macOS
+            "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",  # Linux
+        ]
+        
+        for font_path in font_paths:
+            if os.path.exists(font_path):
+                return ImageFont.truetype(font_path, font_size)
+        
+        # Fallback ke default font
+        return ImageFont.load_default()
+    except:
+        return ImageFont.load_default()
+
+
+# Fungsi untuk mendapatkan mask glyph setiap karakter ASCII
+def get_glyph_masks(font_size=10):
+    """
+    Me-render setiap karakter ASCII_CHARS sekali ke sel berukuran font_size x font_size.
+    Semua glyph digeser dengan offset vertikal yang sama (baseline tetap sejajar)
+    sehingga bagian yang terisi tinta berada di tengah sel dan tidak terpotong.
+    
+    Args:
+        font_size: Ukuran font (dan ukuran sel dalam piksel)
     
-    # Resize frame ke dimensi ASCII yang diinginkan
-    resized_frame = cv2.resize(gray_frame, (width, ascii_height))
+    Returns:
+        Array uint8 berbentuk (jumlah karakter, font_size, font_size), 0 = kosong, 255 = penuh
+    """
+    if font_size not in _glyph_cache:
+        font = load_font(font_size)
+        
+        # Batas atas/bawah tinta semua karakter (bbox relatif terhadap titik gambar (0, 0));
+        # '@' misalnya turun di bawah baseline dan akan terpotong jika digambar di (0, 0)
+        boxes = [font.getbbox(char) for char in ASCII_CHARS]
+        ink_top = min(box[1] for box in boxes if box[3] > box[1])
+        ink_bottom = max(box[3] for box in boxes if box[3] > box[1])
+        offset_y = (font_size - (ink_bottom - ink_top)) // 2 - ink_top
+        
+        masks = np.zeros((len(ASCII_CHARS), font_size, font_size), dtype=np.uint8)
+        for index, char in enumerate(ASCII_CHARS):
+            cell = Image.new('L', (font_size, font_size), color=0)
+            ImageDraw.Draw(cell).text((0, offset_y), char, fill=255, font=font)
+            masks[index] = np.array(cell)
+        _glyph_cache[font_size] = masks
+    return _glyph_cache[font_size]
+
+
+# Fungsi untuk mendapatkan tabel glyph berwarna (mask x setiap nilai channel)
+def get_glyph_levels(font_size=10):
+    """
+    Menghitung sekali hasil perkalian mask glyph dengan setiap nilai channel 0-255,
+    hanya di dalam kotak yang memiliki tinta di salah satu glyph (kolom/baris yang
+    selalu kosong tidak disimpan). Render berwarna cukup mengambil blok dari tabel
+    ini, tanpa perkalian per piksel.
     
-    # Mengonversi setiap piksel menjadi karakter ASCII
-    ascii_art = ""
-    for row in resized_frame:
-        for pixel in row:
-            ascii_art += pixel_to_ascii(pixel)
-        ascii_art += "\n"  # Baris baru setelah setiap row
+    Args:
+        font_size: Ukuran font (dan ukuran sel dalam piksel)
     
-    return ascii_art
+    Returns:
+        Tuple (tabel uint8 berbentuk (jumlah karakter * 256, tinggi kotak * lebar kotak),
+        (baris awal, baris akhir, lebar) kotak tinta di dalam sel)
+    """
+    if font_size not in _glyph_level_cache:
+        glyph_masks = get_glyph_masks(font_size)
+        ink_rows = np.flatnonzero(glyph_masks.any(axis=(0, 2)))
+        ink_cols = np.flatnonzero(glyph_masks.any(axis=(0, 1)))
+        top, bottom = (int(ink_rows[0]), int(ink_rows[-1]) + 1) if len(ink_rows) else (0, 1)
+        width = int(ink_cols[-1]) + 1 if len(ink_cols) else 1
+        
+        # round(mask * nilai / 255), sama dengan cv2.multiply(..., scale=1/255)
+        masks = glyph_masks[:, top:bottom, :width].astype(np.uint32)
+        levels = np.arange(256, dtype=np.uint32)[None, :, None, None]
+        table = ((masks[:, None] * levels + 127) // 255).astype(np.uint8)
+        _glyph_level_cache[font_size] = (table.reshape(len(glyph_masks) * 256, -1),
+                                         (top, bottom, width))
+    return _glyph_level_cache[font_size]
+
+
+# Fungsi untuk me-render grid karakter menjadi gambar (dengan warna per sel)
+def render_ascii_grid(char_grid, colors=None, font_size=10):
+    """
+    Me-render grid indeks karakter menjadi gambar menggunakan operasi array
+    (tanpa draw.text per baris): setiap sel diisi mask glyph karakternya,
+    atau (mode berwarna) blok glyph yang sudah dikalikan dengan warna sel
+    
+    Args:
+        char_grid: Array 2D indeks karakter (tinggi x lebar)
+        colors: Array warna per sel (tinggi x lebar x 3), atau None untuk teks putih.
+                Urutan channel output sama dengan input (BGR tetap BGR)
+        font_size: Ukuran font (dan ukuran sel dalam piksel)
+    
+    Returns:
+        Array uint8 berbentuk (tinggi * font_size, lebar * font_size, 3)
+    """
+    rows, cols = char_grid.shape
+    
+    if colors is None:
+        glyph_masks = get_glyph_masks(font_size)
+        image = np.empty((rows * font_size, cols * font_size, 3), dtype=np.uint8)
+    else:
+        # Piksel di luar kotak tinta tidak pernah ditulis, jadi gambar dimulai dari hitam
+        glyph_levels, (ink_top, ink_bottom, ink_width) = get_glyph_levels(font_size)
+        ink_height = ink_bottom - ink_top
+        image = np.zeros((rows * font_size, cols * font_size, 3), dtype=np.uint8)
+        # Baris tabel untuk setiap sel: karakter * 256 + nilai channel
+        level_base = char_grid.astype(np.intp) * 256
+    
+    # Diproses per pita beberapa baris sel agar data kerja tetap kecil (ramah cache)
+    for top in range(0, rows, RENDER_BAND_ROWS):
+        band_grid = char_grid[top:top + RENDER_BAND_ROWS]
+        band_rows = band_grid.shape[0]
+        band_image = image[top * font_size:(top + band_rows) * font_size]
+        
+        if colors is None:
+            # Ambil mask glyph setiap sel lalu susun menjadi satu pita grayscale;
+            # teks putih: intensitas mask langsung dipakai di ketiga channel
+            glyph_band = glyph_masks[band_grid].transpose(0, 2, 1, 3)
+            glyph_band = glyph_band.reshape(band_rows * font_size, cols * font_size)
+            cv2.cvtColor(glyph_band, cv2.COLOR_GRAY2BGR, dst=band_image)
+        else:
+            # Setiap channel: ambil blok glyph yang sudah dikalikan dengan nilai channel sel,
+            # gabungkan menjadi BGR, lalu letakkan di kotak tinta setiap sel
+            cells = band_rows * cols
+            band_base = level_base[top:top + band_rows].reshape(cells)
+            band_colors = colors[top:top + band_rows].reshape(cells, 3)
+            channels = [np.take(glyph_levels, band_base + band_colors[:, channel], axis=0)
+                        .reshape(cells * ink_height, ink_width) for channel in range(3)]
+            blocks = cv2.merge(channels).reshape(band_rows, cols, ink_height, ink_width, 3)
+            band_cells = band_image.reshape(band_rows, font_size, cols, font_size, 3)
+            band_cells[:, ink_top:ink_bottom, :, :ink_width] = blocks.transpose(0, 2, 1, 3, 4)
+    
+    return image
 
 
 # Fungsi untuk mengonversi ASCII art menjadi image untuk video output
@@ -74,51 +246,283 @@ def ascii_to_image(ascii_art, font_size=10):
         PIL Image object
     """
     # Membaca ASCII art line by line
-    lines = ascii_art.strip().split('\n')
-    
-    # Menghitung dimensi image yang dibutuhkan
+    lines = ascii_art.rstrip('\n').split('\n')
     max_line_len = max(len(line) for line in lines)
-    image_width = max_line_len * font_size
-    image_height = len(lines) * font_size
     
-    # Membuat image baru dengan background hitam
-    img = Image.new('RGB', (image_width, image_height), color='black')
-    draw = ImageDraw.Draw(img)
+    # Mengubah setiap karakter menjadi indeks (karakter tidak dikenal dianggap spasi)
+    blank_index = ASCII_CHARS.index(' ')
+    char_grid = np.array([[ASCII_CHARS.index(char) if char in ASCII_CHARS else blank_index
+                           for char in line.ljust(max_line_len)]
+                          for line in lines], dtype=np.uint8)
     
-    # Mencoba menggunakan font monospace (Courier New)
-    try:
-        # Mencari font yang tersedia di sistem
-        font_paths = [
-            "C:/Windows/Fonts/cour.ttf",  # Windows
-            "C:/Windows/Fonts/courbd.ttf",  # Windows Bold
-            "/System/Library/Fonts/Courier.ttc",  # macOS
-            "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",  # Linux
-        ]
+    # Teks putih pada background hitam
+    return Image.fromarray(render_ascii_grid(char_grid, font_size=font_size))
+
+
+# Cache grid ASCII untuk melewati konversi, penyusunan teks, dan render bagian frame yang tidak berubah
+class AsciiFrameCache:
+    """
+    Menyimpan grid karakter, teks, dan hasil render frame terakhir.
+    Setiap frame baru diperiksa dulu dengan probe murah (sampel piksel per tile
+    yang batasnya mengikuti batas sel): frame tanpa tile berubah tidak dikonversi,
+    disusun, maupun dirender ulang, dan jika perubahannya lokal hanya tile yang
+    berubah yang dikonversi ulang (lewat region ResizePlan.resize). Di dalam tile
+    tersebut sel dibandingkan satu per satu; hanya sel yang berubah yang disusun
+    dan dirender ulang.
+    
+    Perubahan kecil yang lolos dari probe (di bawah CHANGE_PROBE_PIXEL dan
+    CHANGE_PROBE_MEAN) baru terlihat saat tile-nya dikonversi ulang, karena
+    referensi probe hanya diperbarui saat konversi.
+    
+    Args:
+        width: Lebar ASCII art dalam karakter
+        threshold: Ambang selisih warna (per channel) agar sel dianggap berubah
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
+        tile_size: Ukuran tile probe dalam sel
+    """
+    
+    def __init__(self, width=80, threshold=CHANGE_THRESHOLD,
+                 resize_strategy=DEFAULT_RESIZE, cell_aspect=CELL_ASPECT,
+                 tile_size=CHANGE_TILE_SIZE):
+        self.width = width
+        self.threshold = threshold
+        self.resize_strategy = resize_strategy
+        self.cell_aspect = cell_aspect
+        self.tile_size = tile_size
         
-        font = None
-        for font_path in font_paths:
-            if os.path.exists(font_path):
-                font = ImageFont.truetype(font_path, font_size)
-                break
+        self.frame_shape = None
+        self.char_grid = None
+        self.colors = None
+        self.plan = None  # Plan resize untuk ukuran frame saat ini
         
-        if font is None:
-            # Fallback ke default font
-            font = ImageFont.load_default()
-    except:
-        font = ImageFont.load_default()
+        # Probe: batas tile (dalam sel dan dalam sampel) serta sampel/jumlah referensi
+        self.tile_rows = None
+        self.tile_cols = None
+        self.sample_rows = None
+        self.sample_cols = None
+        self.stride = None
+        self.sample_shape = None
+        self.reference = None
+        self.reference_sums = None
+        
+        self.rows = []
+        self.image = None
+        self.image_key = None
+        self.dirty_rows = None
+        self.dirty_cells = None
+        
+        # Statistik
+        self.frames_total = 0
+        self.frames_skipped = 0
+        self.cells_total = 0
+        self.cells_skipped = 0
+    
+    def _tile_edges(self, cell_count, pixel_start, pixel_size):
+        # Tile dimulai setiap tile_size sel; tile yang tidak mendapat sampel sendiri
+        # (sel sangat kecil atau sisa di tepi) digabung dengan tile sebelumnya
+        stride = max(1, min(CHANGE_PROBE_STRIDE, pixel_size))
+        sample_count = pixel_size // stride
+        cell_edges = np.arange(0, cell_count, self.tile_size)
+        sample_edges = -(-pixel_start[cell_edges] // stride)
+        keep = (sample_edges < sample_count) & \
+            (sample_edges > np.concatenate([[-1], np.maximum.accumulate(sample_edges)[:-1]]))
+        return cell_edges[keep], sample_edges[keep], stride
+    
+    def _probe(self, frame):
+        # Sampel setiap stride piksel (nearest dengan skala bulat = piksel ke-stride * i)
+        sample_height, sample_width = self.sample_shape
+        cropped = frame[:sample_height * self.stride[0], :sample_width * self.stride[1]]
+        return cv2.resize(cropped, (sample_width, sample_height), interpolation=cv2.INTER_NEAREST)
+    
+    def _tile_sums(self, samples):
+        # Kanal digabung ke sumbu kolom agar cv2.reduce menjumlah per pita baris tile
+        flat = samples.reshape(samples.shape[0], -1)
+        row_edges = np.append(self.sample_rows, samples.shape[0])
+        sums = np.concatenate([cv2.reduce(flat[start:end], 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S)
+                               for start, end in zip(row_edges[:-1], row_edges[1:])])
+        sums = sums.reshape((len(self.sample_rows),) + samples.shape[1:])
+        return np.add.reduceat(sums, self.sample_cols, axis=1)
     
-    # Menggambar setiap karakter ASCII
-    y = 0
-    for line in lines:
-        # Menggambar teks dengan warna putih pada background hitam
-        draw.text((0, y), line, fill='white', font=font)
-        y += font_size
+    def _reset(self, frame):
+        # Frame pertama (atau ukuran frame berubah): konversi penuh
+        self.frame_shape = frame.shape
+        self.char_grid, self.colors = bgr_frame_to_grid(frame, self.width, self.resize_strategy, self.cell_aspect)
+        
+        # Plan yang sama dipakai untuk konversi ulang tile pada frame berikutnya
+        rows, cols = self.char_grid.shape
+        self.plan = get_resize_plan(frame.shape[0], frame.shape[1], rows, cols, self.resize_strategy)
+        self.rows = [None] * rows
+        self.dirty_rows = np.ones(rows, dtype=bool)
+        self.dirty_cells = np.zeros((rows, cols), dtype=bool)
+        self.image = None
+        
+        # Batas tile mengikuti batas piksel sel dari plan
+        self.tile_rows, self.sample_rows, stride_y = self._tile_edges(rows, self.plan.row_start, frame.shape[0])
+        self.tile_cols, self.sample_cols, stride_x = self._tile_edges(cols, self.plan.col_start, frame.shape[1])
+        self.stride = (stride_y, stride_x)
+        self.sample_shape = (frame.shape[0] // stride_y, frame.shape[1] // stride_x)
+        self.reference = self._probe(frame)
+        self.reference_sums = self._tile_sums(self.reference)
+        
+        # Jumlah sampel per tile (untuk ambang rata-rata)
+        sample_counts = np.outer(np.diff(np.append(self.sample_rows, self.sample_shape[0])),
+                                 np.diff(np.append(self.sample_cols, self.sample_shape[1])))
+        self.sample_counts = sample_counts.reshape(sample_counts.shape + (1,) * (frame.ndim - 2))
     
-    return img
+    def _convert_region(self, frame, rows, cols):
+        # Konversi ulang sel [rows) x [cols) dengan plan yang sama seperti bgr_frame_to_grid,
+        # lalu bandingkan per sel: berubah jika karakternya berbeda atau warnanya
+        # bergeser lebih dari threshold
+        if self.plan.supports_regions:
+            resized_frame = self.plan.resize(frame, rows=rows, cols=cols)
+        else:
+            resized_frame = self.plan.resize(frame)[rows[0]:rows[1], cols[0]:cols[1]]
+        grid = ASCII_LUT[cv2.cvtColor(resized_frame, cv2.COLOR_BGR2GRAY)]
+        
+        region = (slice(*rows), slice(*cols))
+        char_grid, colors = self.char_grid[region], self.colors[region]
+        changed = (grid != char_grid) | (cv2.absdiff(resized_frame, colors).max(axis=2) > self.threshold)
+        
+        # Hanya sel yang berubah yang disalin; warna sel lain tetap nilai saat terakhir
+        # diperbarui agar pergeseran warna pelan yang menumpuk tetap terdeteksi
+        char_grid[changed] = grid[changed]
+        colors[changed] = resized_frame[changed]
+        self.dirty_rows[region[0]] |= changed.any(axis=1)
+        self.dirty_cells[region] |= changed
+        return int(np.count_nonzero(changed))
+    
+    def update(self, frame):
+        """
+        Memperbarui grid dari frame baru
+        
+        Args:
+            frame: Frame video dalam format BGR
+        
+        Returns:
+            Jumlah sel karakter yang berubah (0 jika tidak ada yang berubah)
+        """
+        self.frames_total += 1
+        
+        if frame.shape != self.frame_shape:
+            self._reset(frame)
+            self.cells_total += self.char_grid.size
+            return self.char_grid.size
+        
+        self.cells_total += self.char_grid.size
+        
+        # Probe: bandingkan sampel dengan referensi dari konversi terakhir setiap tile
+        samples = self._probe(frame)
+        sample_diff = cv2.absdiff(samples, self.reference)
+        channels = samples.shape[2] if samples.ndim == 3 else 1
+        
+        # Maksimum per tile sekaligus maksimum antar kanal (kanal ikut di sumbu kolom)
+        tile_diff = np.maximum.reduceat(
+            np.maximum.reduceat(sample_diff.reshape(samples.shape[0], -1), self.sample_rows, axis=0),
+            self.sample_cols * channels, axis=1)
+        sums = self._tile_sums(samples)
+        mean_shift = np.abs(sums - self.reference_sums) > CHANGE_PROBE_MEAN * self.sample_counts
+        if mean_shift.ndim == 3:
+            mean_shift = mean_shift.any(axis=2)
+        dirty_tiles = (tile_diff > CHANGE_PROBE_PIXEL) | mean_shift
+        
+        if not dirty_tiles.any():
+            self.frames_skipped += 1
+            self.cells_skipped += self.char_grid.size
+            return 0
+        
+        # Konversi ulang tile yang berubah. Jika kotak pembatas semua tile yang berubah
+        # paling banyak dua kali jumlahnya (satu objek bergerak, atau hampir semua tile
+        # berubah), cukup satu region; selain itu tile berurutan dalam satu baris tile
+        # digabung menjadi satu region
+        rows, cols = self.char_grid.shape
+        row_edges = np.append(self.tile_rows, rows)
+        col_edges = np.append(self.tile_cols, cols)
+        sample_row_edges = np.append(self.sample_rows, self.sample_shape[0])
+        sample_col_edges = np.append(self.sample_cols, self.sample_shape[1])
+        
+        dirty_rows = np.nonzero(dirty_tiles.any(axis=1))[0]
+        dirty_cols = np.nonzero(dirty_tiles.any(axis=0))[0]
+        bounds = (dirty_rows[0], dirty_rows[-1] + 1, dirty_cols[0], dirty_cols[-1] + 1)
+        if (bounds[1] - bounds[0]) * (bounds[3] - bounds[2]) <= 2 * np.count_nonzero(dirty_tiles):
+            regions = [bounds]
+        else:
+            regions = []
+            for tile_row in dirty_rows:
+                run = np.diff(np.concatenate([[0], dirty_tiles[tile_row].astype(np.int8), [0]]))
+                for first, last in zip(np.nonzero(run == 1)[0], np.nonzero(run == -1)[0]):
+                    regions.append((tile_row, tile_row + 1, first, last))
+        
+        changed_cells = 0
+        converted = np.zeros((rows, cols), dtype=bool)
+        for tile_row0, tile_row1, tile_col0, tile_col1 in regions:
+            # Ditambah satu sel di setiap sisi: perubahan yang masuk ke tile tetangga
+            # kurang dari stride piksel (di antara sampel) ikut terkonversi
+            cell_rows = (max(row_edges[tile_row0] - 1, 0), min(row_edges[tile_row1] + 1, rows))
+            cell_cols = (max(col_edges[tile_col0] - 1, 0), min(col_edges[tile_col1] + 1, cols))
+            changed_cells += self._convert_region(frame, cell_rows, cell_cols)
+            converted[slice(*cell_rows), slice(*cell_cols)] = True
+            
+            # Referensi probe tile ini sekarang frame yang baru dikonversi
+            samples_region = (slice(sample_row_edges[tile_row0], sample_row_edges[tile_row1]),
+                              slice(sample_col_edges[tile_col0], sample_col_edges[tile_col1]))
+            self.reference[samples_region] = samples[samples_region]
+            tiles_region = (slice(tile_row0, tile_row1), slice(tile_col0, tile_col1))
+            self.reference_sums[tiles_region] = sums[tiles_region]
+        
+        self.cells_skipped += self.char_grid.size - int(np.count_nonzero(converted))
+        return changed_cells
+    
+    @property
+    def ascii_art(self):
+        """String ASCII art dari grid saat ini (hanya baris yang berubah yang disusun ulang)"""
+        dirty = np.nonzero(self.dirty_rows)[0]
+        for row, chars in zip(dirty.tolist(), ASCII_CHAR_ARRAY[self.char_grid[dirty]].tolist()):
+            self.rows[row] = "".join(chars) + "\n"
+        self.dirty_rows[:] = False
+        return "".join(self.rows)
+    
+    @property
+    def skipped_fraction(self):
+        """Fraksi sel karakter yang tidak perlu diperbarui"""
+        return self.cells_skipped / self.cells_total if self.cells_total else 0.0
+    
+    def render(self, use_color=False, font_size=10):
+        """
+        Me-render grid saat ini menjadi image BGR, hanya sel yang berubah yang dirender ulang.
+        Jika tidak ada perubahan, objek array yang sama dikembalikan (tidak disalin).
+        
+        Returns:
+            Array uint8 (tinggi * font_size, lebar * font_size, 3)
+        """
+        key = (use_color, font_size)
+        if self.image is None or self.image_key != key:
+            self.image = render_ascii_grid(self.char_grid, self.colors if use_color else None, font_size)
+            self.image_key = key
+            self.dirty_cells[:] = False
+            return self.image
+        
+        if not self.dirty_cells.any():
+            return self.image
+        
+        # Sel yang berubah dirender sekaligus sebagai satu baris grid, lalu setiap blok
+        # font_size x font_size disebar ke posisinya (disalin dulu agar image yang sudah
+        # dikembalikan sebelumnya tidak ikut berubah)
+        cell_rows, cell_cols = np.nonzero(self.dirty_cells)
+        cell_colors = self.colors[cell_rows, cell_cols][None] if use_color else None
+        strip = render_ascii_grid(self.char_grid[cell_rows, cell_cols][None], cell_colors, font_size)
+        blocks = strip.reshape(font_size, len(cell_rows), font_size, 3).transpose(1, 0, 2, 3)
+        
+        rows, cols = self.char_grid.shape
+        self.image = self.image.copy()
+        self.image.reshape(rows, font_size, cols, font_size, 3)[cell_rows, :, cell_cols] = blocks
+        self.dirty_cells[:] = False
+        return self.image
 
 
 # Fungsi utama untuk memproses video
-def process_video(input_path, output_path="ascii_output.mp4", ascii_width=80):
+def process_video(input_path, output_path="ascii_output.mp4", ascii_width=80, use_color=False,
+                  skip_unchanged=True, resize_strategy=DEFAULT_RESIZE, cell_aspect=CELL_ASPECT):
     """
     Memproses file video dan mengonversinya menjadi ASCII art
     
@@ -126,9 +530,16 @@ def process_video(input_path, output_path="ascii_output.mp4", ascii_width=80):
         input_path: Path ke file video input
         output_path: Path ke file video output
         ascii_width: Lebar ASCII art dalam karakter
+        use_color: Apakah setiap karakter diwarnai sesuai warna aslinya
+        skip_unchanged: Konversi ulang hanya tile yang berubah menurut probe; frame tanpa
+            tile berubah (scene statis) tidak dikonversi maupun dirender ulang
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
     """
     print(f"Memproses video: {input_path}")
     print(f"Output akan disimpan di: {output_path}")
+    if use_color:
+        print("Mode: Berwarna (Color)")
     
     # Membuka video
     cap = cv2.VideoCapture(input_path)
@@ -147,6 +558,9 @@ def process_video(input_path, output_path="ascii_output.mp4", ascii_width=80):
     # Inisialisasi list untuk menyimpan frame ASCII
     ascii_frames = []
     
+    # Cache grid untuk melewati bagian frame yang tidak berubah
+    frame_cache = AsciiFrameCache(ascii_width, resize_strategy=resize_strategy, cell_aspect=cell_aspect)
+    
     frame_count = 0
     
     # Loop untuk membaca setiap frame
@@ -156,17 +570,21 @@ def process_video(input_path, output_path="ascii_output.mp4", ascii_width=80):
         if not ret:
             break  # Tidak ada frame lagi
         
-        # Mengonversi frame menjadi ASCII art
-        ascii_art = frame_to_ascii(frame, width=ascii_width)
-        
-        # Mengonversi ASCII art menjadi image
-        ascii_image = ascii_to_image(ascii_art, font_size=10)
-        
-        # Mengonversi PIL Image menjadi numpy array
-        ascii_array = np.array(ascii_image)
-        
-        # Mengonversi RGB menjadi BGR untuk OpenCV
-        ascii_array_bgr = cv2.cvtColor(ascii_array, cv2.COLOR_RGB2BGR)
+        if skip_unchanged:
+            # Probe per tile: hanya tile yang berubah yang dikonversi ulang dan hanya sel
+            # yang berubah yang dirender ulang; frame tanpa tile berubah memakai ulang
+            # teks dan array image yang sama
+            frame_cache.update(frame)
+            ascii_art = frame_cache.ascii_art
+            ascii_array_bgr = frame_cache.render(use_color, font_size=10)
+        else:
+            # Mengonversi frame menjadi grid karakter ASCII (beserta warna tiap sel)
+            char_grid, resized_frame = bgr_frame_to_grid(frame, ascii_width, resize_strategy, cell_aspect)
+            ascii_art = grid_to_ascii(char_grid)
+            
+            # Me-render grid menjadi image BGR (warna sel dari frame asli jika mode warna)
+            colors = resized_frame if use_color else None
+            ascii_array_bgr = render_ascii_grid(char_grid, colors, font_size=10)
         
         ascii_frames.append(ascii_array_bgr)
         
@@ -183,6 +601,10 @@ def process_video(input_path, output_path="ascii_output.mp4", ascii_width=80):
     # Menutup video capture
     cap.release()
     
+    if skip_unchanged and frame_cache.frames_total:
+        print(f"\nSel dilewati (tidak berubah): {frame_cache.skipped_fraction * 100:.1f}%")
+        print(f"Frame dilewati seluruhnya: {frame_cache.frames_skipped}/{frame_cache.frames_total}")
+    
     if not ascii_frames:
         print("Error: Tidak ada frame yang berhasil diproses")
         return
@@ -208,23 +630,54 @@ def main():
     """
     Fungsi utama yang dipanggil saat script dijalankan
     """
-    # Cek apakah ada argumen command line
-    if len(sys.argv) > 1:
-        input_file = sys.argv[1]
-    else:
-        # Default: mencari file input.mp4 di direktori saat ini
-        input_file = "input.mp4"
+    # Default: mencari file input.mp4 di direktori saat ini
+    input_file = "input.mp4"
+    use_color = False
+    skip_unchanged = True
+    resize_strategy = DEFAULT_RESIZE
+    cell_aspect = CELL_ASPECT
+    
+    # Parse argumen command line
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        
+        if arg == '--color':
+            use_color = True
+        elif arg == '--no-skip':
+            skip_unchanged = False
+        elif arg == '--resize' and i + 1 < len(sys.argv):
+            resize_strategy = sys.argv[i + 1]
+            i += 1
+        elif arg == '--aspect' and i + 1 < len(sys.argv):
+            try:
+                cell_aspect = float(sys.argv[i + 1])
+            except ValueError:
+                print(f"Error: '{sys.argv[i + 1]}' bukan angka yang valid untuk --aspect")
+                return
+            i += 1
+        elif not arg.startswith('--'):
+            input_file = arg
+        
+        i += 1
+    
+    if resize_strategy not in RESIZE_STRATEGIES:
+        print(f"Error: Strategi resize '{resize_strategy}' tidak dikenal "
+              f"(pilihan: {', '.join(RESIZE_STRATEGIES)})")
+        return
     
     # Cek apakah file input ada
     if not os.path.exists(input_file):
         print(f"Error: File {input_file} tidak ditemukan!")
         print("\nPenggunaan:")
-        print("  python video_to_ascii.py [input_video.mp4]")
+        print("  python video_to_ascii.py [input_video.mp4] [--color] [--no-skip]")
+        print("                           [--resize area|box|stride|lanczos] [--aspect 0.55]")
         print("\nAtau letakkan file video dengan nama 'input.mp4' di direktori ini")
         return
     
     # Memproses video
-    process_video(input_file)
+    process_video(input_file, use_color=use_color, skip_unchanged=skip_unchanged,
+                  resize_strategy=resize_strategy, cell_aspect=cell_aspect)
 
 
 # Jalankan fungsi main jika script dijalankan langsung
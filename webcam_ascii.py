@@ -8,74 +8,333 @@ Menggunakan library opencv-python dan numpy
 import cv2
 import numpy as np
 import os
+import signal
 import sys
+import threading
+import time
 
-# Mengatur karakter ASCII dari paling gelap hingga paling terang
-ASCII_CHARS = "@%#*+=-:. "
+from image_to_ascii import CELL_ASPECT, DEFAULT_RESIZE, RESIZE_STRATEGIES, get_terminal_size
+from video_to_ascii import AsciiFrameCache, frame_to_ascii
 
-# Fungsi untuk mengonversi piksel grayscale menjadi karakter ASCII
-def pixel_to_ascii(pixel_value):
+# Frame rate default dan batas bawah governor
+DEFAULT_TARGET_FPS = 30
+MIN_FPS = 5
+MIN_ASCII_WIDTH = 20
+
+# Governor: waktu frame > 110% budget -> turunkan beban, < 60% budget -> naikkan lagi
+GOVERNOR_OVERLOAD = 1.1
+GOVERNOR_HEADROOM = 0.6
+
+# Jumlah baris terminal untuk status di atas ASCII art (termasuk baris kursor)
+STATUS_LINES = 2
+
+# Jeda pengecekan ukuran terminal (detik) di sistem tanpa SIGWINCH
+TERMINAL_POLL_INTERVAL = 0.5
+
+# Fungsi untuk clear terminal (cross-platform)
+def clear_terminal():
     """
-    Mengonversi nilai piksel (0-255) menjadi karakter ASCII yang sesuai
-    Nilai lebih gelap -> karakter lebih "tebal" seperti @
-    Nilai lebih terang -> karakter lebih "tipis" seperti spasi
+    Membersihkan terminal untuk membuat tampilan lebih smooth
     """
-    # Menyesuaikan nilai piksel ke indeks karakter ASCII
-    ascii_index = int(pixel_value * (len(ASCII_CHARS) - 1) / 255)
-    return ASCII_CHARS[ascii_index]
+    os.system('cls' if os.name == 'nt' else 'clear')
 
 
-# Fungsi untuk mengonversi frame menjadi ASCII art
-def frame_to_ascii(frame, width=80):
+# Fungsi untuk menghitung lebar ASCII terbesar yang muat di terminal
+def fit_ascii_width(frame_width, frame_height, columns, lines, cell_aspect=CELL_ASPECT):
     """
-    Mengonversi satu frame video menjadi teks ASCII art
+    Menghitung lebar ASCII terbesar agar seluruh frame muat di terminal
+    (baik lebar maupun tingginya)
     
     Args:
-        frame: Frame video dalam format BGR
-        width: Lebar output ASCII (jumlah karakter)
+        frame_width, frame_height: Ukuran frame (piksel)
+        columns, lines: Jumlah kolom dan baris terminal yang tersedia
+        cell_aspect: Rasio lebar/tinggi sel karakter
     
     Returns:
-        String ASCII art dari frame
+        Lebar ASCII dalam karakter (minimal 1)
     """
-    # Mengonversi frame BGR menjadi grayscale
-    gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    rows_per_column = frame_height / frame_width * cell_aspect
+    width_by_height = int(max(1, lines) / rows_per_column) if rows_per_column > 0 else columns
+    return max(1, min(columns, width_by_height))
+
+
+# Pemantau perubahan ukuran terminal
+class TerminalSizeWatcher:
+    """
+    Memantau perubahan ukuran terminal.
+    Di Linux/macOS ukuran hanya dibaca ulang setelah sinyal SIGWINCH diterima,
+    di sistem tanpa SIGWINCH (Windows) ukuran dicek setiap poll_interval detik.
     
-    # Mendapatkan dimensi frame
-    original_height, original_width = gray_frame.shape
+    Args:
+        get_size: Fungsi yang mengembalikan (kolom, baris) terminal
+        clock: Fungsi waktu (detik)
+        poll_interval: Jeda pengecekan ukuran jika SIGWINCH tidak dipakai
+        use_signal: Pasang handler SIGWINCH jika tersedia
+    """
     
-    # Menghitung tinggi ASCII berdasarkan rasio aspect
-    aspect_ratio = original_height / original_width
-    ascii_height = int(width * aspect_ratio * 0.55)  # * 0.55 karena karakter lebih tinggi daripada lebar
+    def __init__(self, get_size=get_terminal_size, clock=time.perf_counter,
+                 poll_interval=TERMINAL_POLL_INTERVAL, use_signal=True):
+        self.get_size = get_size
+        self.clock = clock
+        self.poll_interval = poll_interval
+        self.size = get_size()
+        self.pending = False
+        self.last_poll = clock()
+        
+        # Handler sinyal hanya bisa dipasang dari main thread
+        self.use_signal = (use_signal and hasattr(signal, 'SIGWINCH')
+                           and threading.current_thread() is threading.main_thread())
+        self.previous_handler = None
+        if self.use_signal:
+            self.previous_handler = signal.signal(signal.SIGWINCH, self._on_resize)
     
-    # Resize frame ke dimensi ASCII yang diinginkan
-    resized_frame = cv2.resize(gray_frame, (width, ascii_height))
+    def _on_resize(self, signum, frame):
+        self.pending = True
     
-    # Mengonversi setiap piksel menjadi karakter ASCII
-    ascii_art = ""
-    for row in resized_frame:
-        for pixel in row:
-            ascii_art += pixel_to_ascii(pixel)
-        ascii_art += "\n"  # Baris baru setelah setiap row
+    def notify(self):
+        """Menandai bahwa ukuran terminal mungkin berubah (sama seperti menerima SIGWINCH)"""
+        self.pending = True
     
-    return ascii_art
+    def poll(self):
+        """
+        Mengecek apakah ukuran terminal berubah sejak pengecekan terakhir
+        
+        Returns:
+            True jika ukuran berubah (ukuran baru ada di atribut size)
+        """
+        if not self.use_signal and self.clock() - self.last_poll >= self.poll_interval:
+            self.pending = True
+        if not self.pending:
+            return False
+        
+        self.pending = False
+        self.last_poll = self.clock()
+        size = self.get_size()
+        if size == self.size:
+            return False
+        self.size = size
+        return True
+    
+    def close(self):
+        """Mengembalikan handler SIGWINCH sebelumnya"""
+        if self.use_signal:
+            signal.signal(signal.SIGWINCH, self.previous_handler or signal.SIG_DFL)
+            self.use_signal = False
 
 
-# Fungsi untuk clear terminal (cross-platform)
-def clear_terminal():
+# Pengatur lebar dan frame rate berdasarkan waktu proses per frame
+class FrameRateGovernor:
     """
-    Membersihkan terminal untuk membuat tampilan lebih smooth
+    Menjaga waktu proses frame tetap di dalam budget (1 / fps).
+    Jika waktu frame (rata-rata bergerak) melebihi budget, lebar ASCII
+    diturunkan dulu sampai min_width, setelah itu frame rate. Jika ada
+    sisa waktu, frame rate dinaikkan dulu sampai target, lalu lebar
+    sampai max_width. Setelah setiap perubahan ada jeda beberapa frame
+    agar rata-rata waktu frame menyesuaikan.
+    
+    Args:
+        target_fps: Frame rate yang diinginkan
+        max_width: Lebar ASCII maksimum (biasanya lebar yang muat di terminal)
+        min_width: Lebar ASCII minimum sebelum frame rate diturunkan
+        min_fps: Frame rate minimum
+        smoothing: Bobot waktu frame terbaru pada rata-rata bergerak
+        cooldown: Jumlah frame tanpa perubahan setelah penyesuaian
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
+    
+    def __init__(self, target_fps=DEFAULT_TARGET_FPS, max_width=80, min_width=MIN_ASCII_WIDTH,
+                 min_fps=MIN_FPS, smoothing=0.3, cooldown=10):
+        self.target_fps = target_fps
+        self.fps = target_fps
+        self.min_fps = min(min_fps, target_fps)
+        self.min_width = min_width
+        self.max_width = max(1, max_width)
+        self.width = self.max_width
+        self.smoothing = smoothing
+        self.cooldown = cooldown
+        self.frame_time = None
+        self.wait_frames = 0
+    
+    @property
+    def frame_budget(self):
+        """Waktu yang tersedia untuk satu frame (detik)"""
+        return 1.0 / self.fps
+    
+    def set_max_width(self, max_width):
+        """
+        Mengubah lebar maksimum (misalnya setelah ukuran terminal berubah).
+        Jika lebar saat ini tidak sedang diturunkan oleh governor, lebar
+        langsung mengikuti batas baru.
+        """
+        max_width = max(1, max_width)
+        if self.width >= self.max_width or self.width > max_width:
+            self.width = max_width
+        self.max_width = max_width
+    
+    def update(self, frame_time):
+        """
+        Mencatat waktu proses satu frame dan menyesuaikan lebar/frame rate
+        
+        Args:
+            frame_time: Waktu proses frame terakhir (detik)
+        
+        Returns:
+            True jika lebar atau frame rate berubah
+        """
+        if self.frame_time is None:
+            self.frame_time = frame_time
+        else:
+            self.frame_time += self.smoothing * (frame_time - self.frame_time)
+        
+        if self.wait_frames > 0:
+            self.wait_frames -= 1
+            return False
+        
+        min_width = min(self.min_width, self.max_width)
+        if self.frame_time > self.frame_budget * GOVERNOR_OVERLOAD:
+            # Terlalu lambat: kurangi lebar dulu, baru frame rate
+            if self.width > min_width:
+                self.width = max(min_width, int(self.width * 0.8))
+            elif self.fps > self.min_fps:
+                self.fps = max(self.min_fps, self.fps * 0.8)
+            else:
+                return False
+        elif self.frame_time < self.frame_budget * GOVERNOR_HEADROOM:
+            # Ada sisa waktu: kembalikan frame rate dulu, baru lebar
+            if self.fps < self.target_fps:
+                self.fps = min(self.target_fps, self.fps * 1.25)
+            elif self.width < self.max_width:
+                self.width = min(self.max_width, self.width + max(1, self.width // 10))
+            else:
+                return False
+        else:
+            return False
+        
+        self.wait_frames = self.cooldown
+        return True
+
+
+# Fungsi loop tampilan live (dipakai webcam, bisa diuji dengan sumber frame sintetis)
+def run_live_display(read_frame, max_width=None, target_fps=DEFAULT_TARGET_FPS, skip_unchanged=True,
+                     resize_strategy=DEFAULT_RESIZE, cell_aspect=CELL_ASPECT,
+                     get_size=get_terminal_size, output=None, clock=time.perf_counter,
+                     sleep=time.sleep, max_frames=None, should_stop=None, use_signal=True):
+    """
+    Menampilkan frame secara live sebagai ASCII art di terminal.
+    Lebar dan tinggi otomatis disesuaikan dengan ukuran terminal (SIGWINCH),
+    dan FrameRateGovernor menurunkan/menaikkan lebar atau frame rate sesuai
+    waktu proses frame. Sumber frame, ukuran terminal, jam, dan output bisa
+    diganti sehingga loop ini bisa dijalankan tanpa kamera maupun terminal.
+    
+    Args:
+        read_frame: Fungsi yang mengembalikan (ret, frame BGR), seperti cap.read
+        max_width: Lebar ASCII maksimum (None = selebar terminal)
+        target_fps: Frame rate yang diinginkan
+        skip_unchanged: Konversi ulang hanya tile yang berubah menurut probe; frame tanpa
+            tile berubah tidak dikonversi maupun ditampilkan ulang
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
+        get_size: Fungsi yang mengembalikan (kolom, baris) terminal
+        output: Stream output (default: sys.stdout)
+        clock: Fungsi waktu (detik)
+        sleep: Fungsi untuk menunggu (detik)
+        max_frames: Berhenti setelah sejumlah frame (None = sampai sumber habis)
+        should_stop: Fungsi yang mengembalikan True jika loop harus berhenti
+        use_signal: Pasang handler SIGWINCH jika tersedia
+    
+    Returns:
+        Dictionary statistik: frames, width, fps, skipped_fraction
+    """
+    output = output or sys.stdout
+    watcher = TerminalSizeWatcher(get_size, clock, use_signal=use_signal)
+    governor = None
+    frame_cache = None
+    frame_count = 0
+    redraw = True
+    
+    try:
+        while max_frames is None or frame_count < max_frames:
+            loop_start = clock()
+            ret, frame = read_frame()
+            if not ret:
+                break
+            start = clock()
+            
+            # Sesuaikan lebar maksimum dengan ukuran terminal (saat awal atau setelah resize)
+            if watcher.poll() or governor is None:
+                columns, lines = watcher.size
+                fit_width = fit_ascii_width(frame.shape[1], frame.shape[0], columns,
+                                            lines - STATUS_LINES, cell_aspect)
+                if max_width:
+                    fit_width = min(fit_width, max_width)
+                if governor is None:
+                    governor = FrameRateGovernor(target_fps, fit_width)
+                else:
+                    governor.set_max_width(fit_width)
+                redraw = True
+            
+            # Mengonversi frame menjadi ASCII art
+            if skip_unchanged:
+                # Cache dibuat ulang jika lebar berubah
+                if frame_cache is None or frame_cache.width != governor.width:
+                    frame_cache = AsciiFrameCache(governor.width, resize_strategy=resize_strategy,
+                                                  cell_aspect=cell_aspect)
+                    redraw = True
+                
+                # Frame yang tidak berubah sama sekali tidak perlu ditampilkan ulang
+                changed_cells = frame_cache.update(frame)
+                ascii_art = frame_cache.ascii_art if changed_cells or redraw else None
+            else:
+                ascii_art = frame_to_ascii(frame, governor.width, resize_strategy, cell_aspect)
+            
+            # Gambar ulang di tempat: kursor ke kiri atas, layar dibersihkan penuh hanya saat ukuran berubah
+            if ascii_art is not None:
+                status = (f"Frame {frame_count + 1} | Lebar {governor.width} | {governor.fps:.0f} fps"
+                          f" | Tekan 'q' atau Ctrl+C untuk keluar\n")
+                output.write(("\033[2J" if redraw else "") + "\033[H" + status + ascii_art + "\033[J")
+                output.flush()
+                redraw = False
+            
+            frame_count += 1
+            governor.update(clock() - start)
+            
+            if should_stop is not None and should_stop():
+                output.write("\nKeluar dari aplikasi...\n")
+                break
+            
+            # Tunggu sisa budget frame agar tidak melebihi frame rate governor
+            delay = governor.frame_budget - (clock() - loop_start)
+            if delay > 0:
+                sleep(delay)
+    
+    except KeyboardInterrupt:
+        output.write("\n\nMenghentikan aplikasi...\n")
+    
+    finally:
+        watcher.close()
+    
+    return {
+        'frames': frame_count,
+        'width': governor.width if governor else None,
+        'fps': governor.fps if governor else None,
+        'skipped_fraction': frame_cache.skipped_fraction if frame_cache else 0.0,
+    }
 
 
 # Fungsi utama untuk menampilkan webcam ASCII
-def show_webcam_ascii(camera_index=0, ascii_width=80):
+def show_webcam_ascii(camera_index=0, ascii_width=None, skip_unchanged=True,
+                      resize_strategy=DEFAULT_RESIZE, cell_aspect=CELL_ASPECT,
+                      target_fps=DEFAULT_TARGET_FPS):
     """
     Menampilkan webcam secara real-time dalam bentuk ASCII art
     
     Args:
         camera_index: Index kamera yang digunakan (default: 0)
-        ascii_width: Lebar ASCII art dalam karakter (default: 80)
+        ascii_width: Lebar ASCII maksimum dalam karakter (default: None = selebar terminal)
+        skip_unchanged: Konversi ulang hanya tile yang berubah menurut probe; frame tanpa
+            tile berubah (kamera diam) tidak dikonversi maupun ditampilkan ulang
+        resize_strategy: Strategi downsampling (lihat RESIZE_STRATEGIES)
+        cell_aspect: Rasio lebar/tinggi sel karakter
+        target_fps: Frame rate yang diinginkan (lebar/frame rate diturunkan otomatis jika terlalu berat)
     """
     print(f"Membuka kamera {camera_index}...")
     
@@ -95,52 +354,31 @@ def show_webcam_ascii(camera_index=0, ascii_width=80):
     print("Tekan 'q' untuk keluar")
     print("-" * 50)
     
-    # Variabel untuk kontrol
-    frame_count = 0
+    def read_frame():
+        ret, frame = cap.read()
+        if not ret:
+            print("Error: Tidak bisa membaca frame dari kamera")
+        return ret, frame
     
-    try:
-        # Loop untuk membaca frame dari webcam
-        while True:
-            ret, frame = cap.read()
-            
-            if not ret:
-                print("Error: Tidak bisa membaca frame dari kamera")
-                break
-            
-            # Mengonversi frame menjadi ASCII art
-            ascii_art = frame_to_ascii(frame, width=ascii_width)
-            
-            # Membersihkan terminal sebelum menampilkan frame baru
-            # (uncomment jika ingin smooth animation, tapi bisa membuat terminal berkedip)
-            # clear_terminal()
-            
-            # Menampilkan ASCII art di terminal
-            print(f"Frame {frame_count + 1} | Tekan 'q' untuk keluar")
-            print(ascii_art)
-            print("-" * 50)
-            
-            frame_count += 1
-            
-            # Cek jika user menekan tombol 'q' (polling dengan timeout pendek)
-            # Catatan: Ini hanya bekerja jika terminal/window aktif
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                print("\nKeluar dari aplikasi...")
-                break
-            
-            # Optional: delay kecil untuk mengurangi beban CPU
-            # Uncomment jika framerate terlalu tinggi
-            # import time
-            # time.sleep(0.03)  # ~30 fps
-    
-    except KeyboardInterrupt:
-        print("\n\nMenghentikan aplikasi...")
+    # Cek jika user menekan tombol 'q' (polling dengan timeout pendek)
+    # Catatan: Ini hanya bekerja jika terminal/window aktif
+    def should_stop():
+        return cv2.waitKey(1) & 0xFF == ord('q')
     
+    try:
+        stats = run_live_display(read_frame, ascii_width, target_fps, skip_unchanged,
+                                 resize_strategy, cell_aspect, should_stop=should_stop)
     finally:
         # Tutup kamera
         cap.release()
         cv2.destroyAllWindows()
-        print("Kamera ditutup. Terima kasih!")
+    
+    # Statistik hanya ada jika minimal satu frame berhasil ditampilkan
+    if stats['frames']:
+        print(f"Lebar akhir: {stats['width']} karakter | Frame rate akhir: {stats['fps']:.0f} fps")
+        if skip_unchanged:
+            print(f"Sel dilewati (tidak berubah): {stats['skipped_fraction'] * 100:.1f}%")
+    print("Kamera ditutup. Terima kasih!")
 
 
 # Fungsi main
@@ -150,13 +388,51 @@ def main():
     """
     # Cek apakah ada argumen command line untuk camera index
     camera_index = 0  # Default: webcam pertama
-    ascii_width = 80  # Default: lebar ASCII
+    ascii_width = None  # Default: selebar terminal
+    resize_strategy = DEFAULT_RESIZE
+    cell_aspect = CELL_ASPECT
+    target_fps = DEFAULT_TARGET_FPS
+    
+    # Pisahkan flag opsional dari argumen posisi (camera_index, width)
+    args = []
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg == '--resize' and i + 1 < len(sys.argv):
+            resize_strategy = sys.argv[i + 1]
+            i += 1
+        elif arg == '--aspect' and i + 1 < len(sys.argv):
+            try:
+                cell_aspect = float(sys.argv[i + 1])
+            except ValueError:
+                print(f"Error: '{sys.argv[i + 1]}' bukan angka yang valid untuk --aspect")
+                return
+            i += 1
+        elif arg == '--fps' and i + 1 < len(sys.argv):
+            try:
+                target_fps = float(sys.argv[i + 1])
+            except ValueError:
+                print(f"Error: '{sys.argv[i + 1]}' bukan angka yang valid untuk --fps")
+                return
+            i += 1
+        else:
+            args.append(arg)
+        i += 1
+    
+    if resize_strategy not in RESIZE_STRATEGIES:
+        print(f"Error: Strategi resize '{resize_strategy}' tidak dikenal "
+              f"(pilihan: {', '.join(RESIZE_STRATEGIES)})")
+        return
+    
+    if target_fps <= 0:
+        print("Error: --fps harus lebih dari 0")
+        return
     
-    if len(sys.argv) > 1:
+    if len(args) > 0:
         try:
-            camera_index = int(sys.argv[1])
+            camera_index = int(args[0])
         except ValueError:
-            print(f"Error: '{sys.argv[1]}' bukan angka yang valid")
+            print(f"Error: '{args[0]}' bukan angka yang valid")
             print("\nPenggunaan:")
             print("  python webcam_ascii.py [camera_index]")
             print("\nContoh:")
@@ -164,17 +440,18 @@ def main():
             print("  python webcam_ascii.py 1    # Menggunakan kamera kedua")
             return
     
-    if len(sys.argv) > 2:
+    if len(args) > 1:
         try:
-            ascii_width = int(sys.argv[2])
+            ascii_width = int(args[1])
         except ValueError:
-            print(f"Error: '{sys.argv[2]}' bukan angka yang valid")
+            print(f"Error: '{args[1]}' bukan angka yang valid")
             print("\nPenggunaan:")
-            print("  python webcam_ascii.py [camera_index] [width]")
+            print("  python webcam_ascii.py [camera_index] [width] [--fps 30] [--resize area|box|stride|lanczos] [--aspect 0.55]")
             return
     
     # Menampilkan webcam ASCII
-    show_webcam_ascii(camera_index, ascii_width)
+    show_webcam_ascii(camera_index, ascii_width, resize_strategy=resize_strategy, cell_aspect=cell_aspect,
+                      target_fps=target_fps)
 
 
 # Jalankan fungsi main jika script dijalankan langsung